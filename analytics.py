@@ -1,20 +1,51 @@
 """SQLite-based analytics system for tracking chatbot interactions."""
+import atexit
+import queue
 import sqlite3
 import json
+import logging
 import os
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from collections import Counter
 
+logger = logging.getLogger(__name__)
+
+_INSERT_INTERACTION_SQL = """
+    INSERT INTO question_analytics 
+    (timestamp, question, answer, source_count, response_time_ms, 
+     linkedin_included, is_career_related, metadata, session_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Background writer batching: flush when this many rows are queued or after this many seconds
+WRITE_BATCH_SIZE = 32
+WRITE_BATCH_INTERVAL_S = 0.5
+# Queued by flush(): the writer commits what it has immediately instead of waiting out the interval
+_FLUSH_NOW = object()
+
 class ChatbotAnalytics:
     def __init__(self, db_path: str = "chatbot_analytics.db"):
         """Initialize analytics database."""
         self.db_path = db_path
         self._init_database()
+        self._write_queue: "queue.Queue[Tuple]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection; synchronous=NORMAL is per-connection (WAL persists in the file)."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
     
     def _init_database(self):
-        """Create the analytics table if it doesn't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        """Create the analytics tables if they don't exist (additive; see ANALYTICS_GUIDE.md)."""
+        with self._connect() as conn:
+            # WAL: readers don't block the background writer and commits skip the rollback-journal fsyncs
+            conn.execute("PRAGMA journal_mode=WAL")
             cursor = conn.cursor()
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS question_analytics (
@@ -43,6 +74,16 @@ class ChatbotAnalytics:
                 ON question_analytics(is_career_related)
             """)
             
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS answer_feedback (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TEXT NOT NULL,
+                    session_id TEXT,
+                    question TEXT NOT NULL,
+                    rating INTEGER NOT NULL
+                )
+            """)
+            
             conn.commit()
     
     def log_interaction(self, 
@@ -70,32 +111,117 @@ class ChatbotAnalytics:
         Returns:
             int: The ID of the logged interaction
         """
-        timestamp = datetime.now().isoformat()
+        row = self._interaction_row(
+            question, answer, source_count, response_time_ms,
+            linkedin_included, is_career_related, metadata, session_id
+        )
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO question_analytics 
-                (timestamp, question, answer, source_count, response_time_ms, 
-                 linkedin_included, is_career_related, metadata, session_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                timestamp, question, answer, source_count, response_time_ms,
-                linkedin_included, is_career_related, 
-                json.dumps(metadata) if metadata else None,
-                session_id
-            ))
+            cursor.execute(_INSERT_INTERACTION_SQL, row)
             
             interaction_id = cursor.lastrowid
             conn.commit()
             
         return interaction_id
     
+    def log_feedback(self, session_id: Optional[str], question: str, rating: int) -> None:
+        """Record a 1-5 star rating for the answer to a question."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO answer_feedback (timestamp, session_id, question, rating) VALUES (?, ?, ?, ?)",
+                (datetime.now().isoformat(), session_id, question, rating)
+            )
+            conn.commit()
+    
+    def queue_interaction(self, 
+                          question: str, 
+                          answer: str, 
+                          source_count: int = 0,
+                          response_time_ms: Optional[float] = None,
+                          linkedin_included: bool = False,
+                          is_career_related: bool = False,
+                          metadata: Optional[Dict] = None,
+                          session_id: Optional[str] = None) -> None:
+        """
+        Queue an interaction for a background batched write.
+        
+        Same arguments as log_interaction(), but returns immediately; a daemon
+        thread inserts queued rows with executemany() every
+        WRITE_BATCH_INTERVAL_S seconds or once WRITE_BATCH_SIZE rows are waiting.
+        """
+        self._ensure_writer()
+        self._write_queue.put_nowait(self._interaction_row(
+            question, answer, source_count, response_time_ms,
+            linkedin_included, is_career_related, metadata, session_id
+        ))
+    
+    def flush(self) -> None:
+        """Block until every queued interaction has been written.
+        
+        Wakes the writer so pending rows are committed right away (one INSERT
+        batch, milliseconds) rather than after WRITE_BATCH_INTERVAL_S.
+        """
+        if self._writer is not None:
+            self._write_queue.put_nowait(_FLUSH_NOW)
+        self._write_queue.join()
+    
+    @staticmethod
+    def _interaction_row(question, answer, source_count, response_time_ms,
+                         linkedin_included, is_career_related, metadata, session_id) -> Tuple:
+        return (
+            datetime.now().isoformat(), question, answer, source_count, response_time_ms,
+            linkedin_included, is_career_related,
+            json.dumps(metadata) if metadata else None,
+            session_id
+        )
+    
+    def _ensure_writer(self) -> None:
+        """Start the background writer thread on first use."""
+        if self._writer is not None:
+            return
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._writer_loop, name="analytics-writer", daemon=True
+                )
+                self._writer.start()
+                atexit.register(self.flush)
+    
+    def _writer_loop(self) -> None:
+        conn: Optional[sqlite3.Connection] = None  # one connection for the writer's lifetime
+        while True:
+            items = [self._write_queue.get()]
+            deadline = time.monotonic() + WRITE_BATCH_INTERVAL_S
+            while len(items) < WRITE_BATCH_SIZE and items[-1] is not _FLUSH_NOW:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(self._write_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            batch = [row for row in items if row is not _FLUSH_NOW]
+            try:
+                if batch:
+                    if conn is None:
+                        conn = self._connect()
+                    with conn:
+                        conn.executemany(_INSERT_INTERACTION_SQL, batch)
+            except Exception as e:
+                logger.warning(f"Analytics batch write failed ({len(batch)} rows dropped): {e}")
+                if conn is not None:
+                    conn.close()
+                    conn = None  # reconnect on the next batch
+            finally:
+                for _ in items:
+                    self._write_queue.task_done()
+    
     def get_analytics_summary(self, days: int = 30) -> Dict[str, Any]:
         """Get analytics summary for the last N days."""
         cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Total interactions
@@ -156,9 +282,25 @@ class ChatbotAnalytics:
             "common_question_patterns": common_patterns
         }
     
+    def get_summary_stats(self) -> Dict[str, Any]:
+        """Get all-time sidebar stats (questions, sessions, avg response seconds) in one query."""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT COUNT(*), COUNT(DISTINCT session_id), AVG(response_time_ms)
+                FROM question_analytics
+            """)
+            total_questions, unique_sessions, avg_response_time_ms = cursor.fetchone()
+        
+        return {
+            "total_questions": total_questions,
+            "unique_sessions": unique_sessions,
+            "avg_response_time": avg_response_time_ms / 1000 if avg_response_time_ms else None
+        }
+    
     def get_recent_interactions(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get the most recent interactions."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
@@ -185,7 +327,7 @@ class ChatbotAnalytics:
             where_clause = "WHERE timestamp >= ?"
             params.append(cutoff_date)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
@@ -202,14 +344,13 @@ class ChatbotAnalytics:
             if rows:
                 writer = csv.DictWriter(csvfile, fieldnames=rows[0].keys())
                 writer.writeheader()
-                for row in rows:
-                    writer.writerow(dict(row))
+                writer.writerows(map(dict, rows))
         
         return len(rows)
     
     def get_database_stats(self) -> Dict[str, Any]:
         """Get basic database statistics."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("SELECT COUNT(*) FROM question_analytics")
@@ -235,7 +376,7 @@ class ChatbotAnalytics:
         """Get the most popular/frequently asked questions."""
         cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Get question frequency, grouping similar questions
@@ -55,6 +55,10 @@ class Config:
     OPENAI_TEMPERATURE: float = float(os.getenv("OPENAI_TEMPERATURE", "0.1"))
     # Default to modern embedding model; override via env/Secrets if needed
     OPENAI_EMBEDDING_MODEL: str = os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
+    # Per-request OpenAI timeout; timeouts, connection errors, 429s and 5xx responses are
+    # retried by the client with backoff, other errors (auth, bad request) fail immediately
+    OPENAI_TIMEOUT_SECONDS: float = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "60"))
+    OPENAI_MAX_RETRIES: int = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
     
     # Data Configuration (readable from secrets/env with safe defaults)
     @property
@@ -76,6 +80,13 @@ class Config:
     VECTOR_DB_BACKEND: str = os.getenv("VECTOR_DB_BACKEND", "faiss")  # only 'faiss' supported now
     VECTOR_DB_PATH: str = os.getenv("VECTOR_DB_PATH", "faiss_index")  # directory for faiss index files
     RETRIEVER_SCORE_THRESHOLD: float = float(os.getenv("RETRIEVER_SCORE_THRESHOLD", "0.7"))
+    # Corpora at least this large are indexed with IVF-PQ instead of an exhaustive flat index
+    FAISS_IVF_MIN_VECTORS: int = int(os.getenv("FAISS_IVF_MIN_VECTORS", "1024"))
+    FAISS_NPROBE: int = int(os.getenv("FAISS_NPROBE", "8"))
+    FAISS_QUANTIZE: str = os.getenv("FAISS_QUANTIZE", "sq8")  # "sq8" | "fp32" for sub-IVF corpora
+    
+    # Semantic answer cache (cosine similarity required to reuse a previous answer)
+    SEMANTIC_CACHE_THRESHOLD: float = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
     
     # Validation
     def validate(self) -> bool:
@@ -12,10 +12,13 @@ Key Patterns:
 - Clear error surfacing for faster debugging
 """
 
+import math
 import os
 from typing import Optional
 from pathlib import Path
 
+import faiss
+import httpx
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langchain_community.document_loaders.csv_loader import CSVLoader
 from langchain_community.vectorstores import FAISS
@@ -25,6 +28,7 @@ from config import config
 
 _llm_instance: Optional[ChatOpenAI] = None
 _embeddings_instance: Optional[OpenAIEmbeddings] = None
+_async_http_client: Optional[httpx.AsyncClient] = None
 
 INDEX_DIR = Path(config.VECTOR_DB_PATH)
 FAISS_INDEX_FILE = INDEX_DIR / "index.faiss"
@@ -36,6 +40,16 @@ def _ensure_config_valid() -> None:
     config.validate()
 
 
+def _get_async_http_client() -> httpx.AsyncClient:
+    # Pooled connections for ainvoke(); only safe on one long-lived event loop
+    global _async_http_client
+    if _async_http_client is None:
+        _async_http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+    return _async_http_client
+
+
 def _get_llm() -> ChatOpenAI:
     global _llm_instance
     if _llm_instance is None:
@@ -44,6 +58,10 @@ def _get_llm() -> ChatOpenAI:
             model=config.OPENAI_MODEL,
             temperature=config.OPENAI_TEMPERATURE,
             api_key=config.OPENAI_API_KEY,
+            streaming=True,  # emit on_llm_new_token callbacks; invoke() still returns the full answer
+            timeout=config.OPENAI_TIMEOUT_SECONDS,
+            max_retries=config.OPENAI_MAX_RETRIES,  # the only retry layer: transient errors only
+            http_async_client=_get_async_http_client(),
         )
     return _llm_instance
 
@@ -55,6 +73,9 @@ def _get_embeddings() -> OpenAIEmbeddings:
         _embeddings_instance = OpenAIEmbeddings(
             model=config.OPENAI_EMBEDDING_MODEL,
             api_key=config.OPENAI_API_KEY,
+            timeout=config.OPENAI_TIMEOUT_SECONDS,
+            max_retries=config.OPENAI_MAX_RETRIES,
+            http_async_client=_get_async_http_client(),
         )
     return _embeddings_instance
 
@@ -70,26 +91,85 @@ def _load_portfolio_documents():
     return docs
 
 
+SNIPPET_LENGTH = 300
+
+
+def _make_snippet(content: str) -> str:
+    """Truncated preview shown in the Sources expander."""
+    if len(content) > SNIPPET_LENGTH:
+        return content[:SNIPPET_LENGTH] + "..."
+    return content
+
+
 def vector_db_exists() -> bool:
     return FAISS_INDEX_FILE.exists() and FAISS_STORE_FILE.exists()
 
 
+def _compress_index(vectordb: FAISS) -> None:
+    """Replace the default flat FP32 index with a compressed one.
+
+    - Corpora of FAISS_IVF_MIN_VECTORS or more: IVF-PQ (sub-linear search)
+    - Smaller corpora with FAISS_QUANTIZE="sq8": exhaustive search over
+      8-bit scalar-quantized vectors (4x less memory, negligible recall loss)
+    - FAISS_QUANTIZE="fp32": keep the exact flat index
+    """
+    flat = vectordb.index
+    n, d = flat.ntotal, flat.d
+    if n >= config.FAISS_IVF_MIN_VECTORS:
+        nlist = max(4, int(math.sqrt(n)))
+        quantizer = faiss.IndexFlatL2(d)
+        if d % 16 == 0:
+            index = faiss.IndexIVFPQ(quantizer, d, nlist, 16, 8)
+        else:  # PQ needs d divisible by the sub-quantizer count
+            index = faiss.IndexIVFFlat(quantizer, d, nlist)
+    elif config.FAISS_QUANTIZE == "sq8":
+        index = faiss.IndexScalarQuantizer(d, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_L2)
+    else:
+        return
+    xb = flat.reconstruct_n(0, n)
+    index.train(xb)
+    index.add(xb)  # same insertion order keeps index_to_docstore_id valid
+    vectordb.index = index
+
+
+def set_nprobe(vectordb: FAISS, nprobe: int) -> bool:
+    """Set IVF cells probed per query; returns False for non-IVF indexes."""
+    try:
+        faiss.extract_index_ivf(vectordb.index).nprobe = nprobe
+        return True
+    except RuntimeError:
+        return False
+
+
+def get_nprobe(vectordb: FAISS) -> Optional[int]:
+    """IVF cells probed per query, or None for non-IVF indexes."""
+    try:
+        return faiss.extract_index_ivf(vectordb.index).nprobe
+    except RuntimeError:
+        return None
+
+
 def create_vector_db() -> None:
     """Build and persist FAISS index from portfolio CSV."""
     INDEX_DIR.mkdir(parents=True, exist_ok=True)
     docs = _load_portfolio_documents()
+    for doc in docs:
+        doc.metadata["snippet"] = _make_snippet(doc.page_content)
     vectordb = FAISS.from_documents(docs, embedding=_get_embeddings())
+    _compress_index(vectordb)
     vectordb.save_local(str(INDEX_DIR))
 
 
 def _load_vector_db() -> FAISS:
     if not vector_db_exists():
         raise FileNotFoundError("FAISS index missing. Run create_vector_db() first.")
-    return FAISS.load_local(
+    vectordb = FAISS.load_local(
         str(INDEX_DIR),
         _get_embeddings(),
         allow_dangerous_deserialization=True,  # needed for current langchain serialization format
     )
+    set_nprobe(vectordb, config.FAISS_NPROBE)
+    return vectordb
 
 # ---------------- Prompt Engineering ---------------- #
 
@@ -9,12 +9,42 @@ Author: Senior Generative AI Applications Engineer
 """
 
 import streamlit as st
+import asyncio
+import atexit
+import concurrent.futures
+import datetime
+import functools
+import importlib
+import json
+import logging
+import queue
 import os
+import re
+import secrets
+import threading
 import time
-import uuid
+import types
+import urllib.request
 from typing import List, Optional
+from langchain_core.callbacks import BaseCallbackHandler
 from config import Config
 from analytics import ChatbotAnalytics
+from langchain_helper import (
+    get_qa_chain as build_qa_chain,
+    create_vector_db,
+    vector_db_exists,
+    get_nprobe,
+    _get_embeddings,
+    _make_snippet,
+)
+from semantic_cache import SemanticCache
+
+try:  # optional: faster JSON encoding for stored records
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
 
 # Application Configuration
 st.set_page_config(
@@ -24,78 +54,227 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Headshot & secrets helpers (defined before the special experiences that use them)
+
+@st.cache_data(show_spinner=False)
+def _get_secret(key: str, default=None):
+    """Streamlit secret lookup, parsed once per process per key."""
+    try:
+        return st.secrets.get(key, default)
+    except Exception:  # no secrets.toml configured
+        return default
+
+def _headshot_settings() -> tuple:
+    """(display_name, headshot_url) from Streamlit secrets."""
+    return _get_secret("HEADSHOT_NAME", "Noah"), _get_secret("HEADSHOT_URL")
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_image(url: str) -> bytes:
+    """Download a remote image at most once an hour instead of on every rerun."""
+    with urllib.request.urlopen(url, timeout=5) as response:
+        return response.read()
+
+def _headshot_image(url: str):
+    """Cached image bytes for url, falling back to the url if the download fails."""
+    try:
+        return _fetch_image(url)
+    except Exception:
+        return url  # failures are not cached, so the next rerun retries
+
+# Initialize Configuration
+@st.cache_resource
+def get_config() -> Config:
+    """Get cached configuration instance."""
+    return Config()
+
+def _build_qa_chain_logged():
+    """Worker-thread chain build: no Streamlit calls, failures logged before they propagate."""
+    try:
+        return build_qa_chain()
+    except Exception as e:
+        logger.warning(f"Background QA chain build failed: {e}")
+        raise
+
+@st.cache_resource(show_spinner=False)
+def _start_qa_chain() -> concurrent.futures.Future:
+    """Build the RetrievalQA chain once, in a worker thread, so the index load doesn't block a render."""
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="qa-chain-init")
+    future = executor.submit(_build_qa_chain_logged)
+    executor.shutdown(wait=False)
+    return future
+
+def get_qa_chain():
+    """RetrievalQA chain, waiting for background initialization on first use."""
+    try:
+        return _start_qa_chain().result()
+    except Exception as e:
+        _start_qa_chain.clear()  # retry on the next call instead of caching the failure
+        st.error(f"Failed to initialize Q&A system: {e}")
+        st.stop()
+
+def qa_chain_ready() -> bool:
+    """True once the QA chain has loaded successfully; never blocks or raises."""
+    future = _start_qa_chain()
+    return future.done() and future.exception() is None
+
+@st.cache_data(ttl=60, show_spinner=False)
+def index_exists() -> bool:
+    """Cached FAISS index presence check (avoids filesystem probes on every rerun)."""
+    return vector_db_exists()
+
+@st.cache_resource(show_spinner=False)
+def get_semantic_cache():
+    """Initialize and cache the semantic answer cache (persisted on shutdown)."""
+    cache = SemanticCache(
+        _get_embeddings().embed_query,
+        threshold=get_config().SEMANTIC_CACHE_THRESHOLD,
+    )
+    atexit.register(cache.save)
+    return cache
+
+@st.cache_resource(show_spinner=False)
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Long-lived event loop thread for async chain calls.
+
+    asyncio.run() per question would close the loop the pooled async HTTP
+    connections are bound to; one persistent loop keeps them reusable.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True, name="chain-event-loop").start()
+    return loop
+
+@st.cache_resource(show_spinner=False)
+def _start_prewarm() -> threading.Thread:
+    """Start the QA chain build and open the OpenAI connection pools in the background.
+
+    Started before the user-type screen, so the FAISS load, client setup and
+    TLS handshakes happen while the visitor is still choosing instead of on
+    the first question. The chain is built by _start_qa_chain's worker, which
+    never touches Streamlit and only caches a chain that actually loaded.
+    """
+    if vector_db_exists():
+        _start_qa_chain()
+    loop = _get_event_loop()
+
+    def warm() -> None:
+        try:
+            _get_embeddings().embed_query("warmup")  # sync pool: semantic cache lookups
+            asyncio.run_coroutine_threadsafe(  # async pool: answer generation
+                _get_embeddings().aembed_query("warmup"), loop
+            ).result()
+        except Exception as e:
+            # best-effort: the first question initializes whatever is still cold
+            logger.warning(f"OpenAI connection prewarm failed: {e}")
+
+    thread = threading.Thread(target=warm, daemon=True, name="qa-prewarm")
+    thread.start()
+    return thread
+
+if get_config().OPENAI_API_KEY:
+    _start_prewarm()
+
+# Static page copy for the special experiences: one markdown element per section,
+# built once at import instead of several st.markdown calls per rerun
+_CASUAL_INTRO_MD = (
+    "# 🎲 Welcome, Random Visitor! 👋\n\n"
+    "Since you just stumbled upon this, let me give you the fun tour of who Noah is!\n\n"
+    "## 🚀 Noah's Wild Career Journey"
+)
+
+_CAREER_JOURNEY_MD = """
+**Plot twist alert!** 📈
+
+Noah went from:
+- 💪 **Gym sales guy** (learning to persuade people)
+- 🏠 **Real estate** (bigger sales, bigger stakes)  
+- 📦 **Logistics** (keeping stuff moving)
+- ⚡ **Tesla Sales** (now we're talking tech!)
+- 🤖 **AI Engineer** (current plot: building smart assistants)
+
+Oh, and he also had **10 MMA cage fights** along the way because... why not? 🥊
+"""
+
+_MMA_HIGHLIGHTS_MD = (
+    "---\n\n"
+    "## 🥊 MMA Highlights - The Good Stuff!\n\n"
+    "**10 cage fights, amateur & professional. Here's the crown jewel:**\n\n"
+    "### 🏆 Title Fight Victory\n\n"
+    "Noah defeated 5-0 fighter Edgar Sorto to win the **Fierce Fighting Championship amateur 135-lb title**!"
+)
+
+_FUN_FACTS_MD = (
+    "*Pretty cool for a guy who now codes AI assistants, right?* 😎\n\n"
+    "---\n\n"
+    "## 🌟 Random Fun Facts\n\n"
+    + "\n".join(f"- {fact}" for fact in (
+        "🌭 Can eat 10 hotdogs in one sitting (verified!)",
+        "🧠 Got into AI after watching AlphaZero demolish Stockfish in 2017",
+        "💻 Went from zero coding to building this AI assistant in months",
+        "🎯 Chose Tesla as a 'bridge job' to transition from sales to tech",
+        "🤖 Uses GitHub Copilot and Claude to accelerate development (smart, not lazy!)",
+    ))
+    + "\n\n---\n\n## 💬 Want to Connect with Noah?"
+)
+
+_CASUAL_EASTER_EGG_MD = (
+    "---\n\n"
+    "*P.S. This AI assistant you're using? Noah built it from scratch. Meta, right?* 🤯"
+)
+
+_CRUSH_INTRO_MD = (
+    "# 😍 Aww, That's So Sweet! 💕\n\n"
+    "Someone has a crush on Noah! Let me help you with that... 😉\n\n"
+    "## ✨ What Makes Noah So Crush-Worthy?"
+)
+
+_CRUSH_QUALITIES_MD = """
+**🔥 The Attractive Qualities:**
+- 💪 **MMA Fighter**: 10 cage fights, championship title holder
+- 🧠 **Smart Career Pivot**: Sales → AI Engineering (strategic thinker!)
+- 🚀 **Self-Driven**: Learned coding and built this AI assistant 
+- 💼 **Business Savvy**: Understands both tech and business sides
+- 🎯 **Goal-Oriented**: Clear 3-year vision, works toward it daily
+"""
+
+_CRUSH_TRAITS_MD = """
+**😊 The Personality Traits:**
+- 🤝 **Great Communicator**: Bridges technical and non-technical teams
+- 💡 **Problem Solver**: Finds creative solutions to complex challenges
+- 📈 **Growth Mindset**: Constantly learning and improving
+- 🏆 **Competitive**: But in a healthy, motivating way
+- 🌭 **Fun Side**: Can eat 10 hotdogs in one sitting (impressive!)
+"""
+
+_CONFESS_PROMPT_MD = (
+    "---\n\n"
+    "## 💌 Ready to Confess?\n\n"
+    "**Would you like to confess anonymously or openly?**"
+)
+
 # Helper functions for special user experiences
 def render_casual_visitor_experience():
     """Special experience for casual visitors with MMA highlights and contact option."""
-    st.markdown("# 🎲 Welcome, Random Visitor! 👋")
-    st.markdown("Since you just stumbled upon this, let me give you the fun tour of who Noah is!")
-    
-    # Career overview in casual tone
-    st.markdown("## 🚀 Noah's Wild Career Journey")
+    st.markdown(_CASUAL_INTRO_MD)
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        st.markdown("""
-        **Plot twist alert!** 📈
-        
-        Noah went from:
-        - 💪 **Gym sales guy** (learning to persuade people)
-        - 🏠 **Real estate** (bigger sales, bigger stakes)  
-        - 📦 **Logistics** (keeping stuff moving)
-        - ⚡ **Tesla Sales** (now we're talking tech!)
-        - 🤖 **AI Engineer** (current plot: building smart assistants)
-        
-        Oh, and he also had **10 MMA cage fights** along the way because... why not? 🥊
-        """)
+        st.markdown(_CAREER_JOURNEY_MD)
     
     with col2:
         # Try to show headshot if available
-        headshot_url = None
-        try:
-            headshot_url = st.secrets.get("HEADSHOT_URL")
-        except:
-            pass
-        
+        headshot_url = _get_secret("HEADSHOT_URL")
         if headshot_url:
-            st.image(headshot_url, width=200, caption="The man himself! 😄")
+            st.image(_headshot_image(headshot_url), width=200, caption="The man himself! 😄")
         else:
             st.markdown("🖼️ *[Noah's photo would go here]*")
     
-    st.markdown("---")
-    
-    # MMA Highlights Section
-    st.markdown("## 🥊 MMA Highlights - The Good Stuff!")
-    st.markdown("**10 cage fights, amateur & professional. Here's the crown jewel:**")
-    
-    # Embed YouTube video
-    st.markdown("### 🏆 Title Fight Victory")
-    st.markdown("Noah defeated 5-0 fighter Edgar Sorto to win the **Fierce Fighting Championship amateur 135-lb title**!")
-    
-    # YouTube embed
+    # MMA Highlights Section with the title fight embed
+    st.markdown(_MMA_HIGHLIGHTS_MD)
     video_url = "https://www.youtube.com/watch?v=MgcAdEoJMzg"
     st.video(video_url)
     
-    st.markdown("*Pretty cool for a guy who now codes AI assistants, right?* 😎")
-    
-    st.markdown("---")
-    
-    # Fun facts section
-    st.markdown("## 🌟 Random Fun Facts")
-    fun_facts = [
-        "🌭 Can eat 10 hotdogs in one sitting (verified!)",
-        "🧠 Got into AI after watching AlphaZero demolish Stockfish in 2017",
-        "💻 Went from zero coding to building this AI assistant in months",
-        "🎯 Chose Tesla as a 'bridge job' to transition from sales to tech",
-        "🤖 Uses GitHub Copilot and Claude to accelerate development (smart, not lazy!)"
-    ]
-    
-    for fact in fun_facts:
-        st.markdown(f"- {fact}")
-    
-    st.markdown("---")
-    
-    # Contact section
-    st.markdown("## 💬 Want to Connect with Noah?")
+    # Fun facts and contact section heading
+    st.markdown(_FUN_FACTS_MD)
     
     col1, col2 = st.columns(2)
     with col1:
@@ -111,51 +290,26 @@ def render_casual_visitor_experience():
             render_contact_form()
     
     # Easter egg
-    st.markdown("---")
-    st.markdown("*P.S. This AI assistant you're using? Noah built it from scratch. Meta, right?* 🤯")
+    st.markdown(_CASUAL_EASTER_EGG_MD)
 
 def render_crush_confession_experience():
     """Special experience for crush confessions with anonymous/open options."""
-    st.markdown("# 😍 Aww, That's So Sweet! 💕")
-    st.markdown("Someone has a crush on Noah! Let me help you with that... 😉")
-    
-    # Show Noah's attractive qualities first
-    st.markdown("## ✨ What Makes Noah So Crush-Worthy?")
+    st.markdown(_CRUSH_INTRO_MD)
     
     col1, col2 = st.columns(2)
     with col1:
-        st.markdown("""
-        **🔥 The Attractive Qualities:**
-        - 💪 **MMA Fighter**: 10 cage fights, championship title holder
-        - 🧠 **Smart Career Pivot**: Sales → AI Engineering (strategic thinker!)
-        - 🚀 **Self-Driven**: Learned coding and built this AI assistant 
-        - 💼 **Business Savvy**: Understands both tech and business sides
-        - 🎯 **Goal-Oriented**: Clear 3-year vision, works toward it daily
-        """)
+        st.markdown(_CRUSH_QUALITIES_MD)
     
     with col2:
-        st.markdown("""
-        **😊 The Personality Traits:**
-        - 🤝 **Great Communicator**: Bridges technical and non-technical teams
-        - 💡 **Problem Solver**: Finds creative solutions to complex challenges
-        - 📈 **Growth Mindset**: Constantly learning and improving
-        - 🏆 **Competitive**: But in a healthy, motivating way
-        - 🌭 **Fun Side**: Can eat 10 hotdogs in one sitting (impressive!)
-        """)
+        st.markdown(_CRUSH_TRAITS_MD)
     
     # Headshot if available
-    try:
-        headshot_url = st.secrets.get("HEADSHOT_URL")
-        if headshot_url:
-            st.image(headshot_url, width=250, caption="The object of your affection! 😍")
-    except:
-        pass
-    
-    st.markdown("---")
+    headshot_url = _get_secret("HEADSHOT_URL")
+    if headshot_url:
+        st.image(_headshot_image(headshot_url), width=250, caption="The object of your affection! 😍")
     
     # Confession options
-    st.markdown("## 💌 Ready to Confess?")
-    st.markdown("**Would you like to confess anonymously or openly?**")
+    st.markdown(_CONFESS_PROMPT_MD)
     
     col1, col2 = st.columns(2)
     
@@ -227,33 +381,66 @@ def handle_confession_flow(confession_type: str):
                     st.success(f"💕 Your confession has been sent to Noah, {name}!")
                     st.balloons()
 
+CONFESSIONS_FILE = "confessions/confessions.jsonl"
+MESSAGES_FILE = "messages/messages.jsonl"
+
+@functools.lru_cache(maxsize=8)
+def _ensure_parent_dir(path: str) -> bool:
+    """Create the parent directory of path once per process."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return True
+
+def _record_writer_loop(records: queue.Queue) -> None:
+    """Drain queued (path, line bytes) pairs, appending everything waiting with one write per file."""
+    while True:
+        batch = [records.get()]
+        while True:
+            try:
+                batch.append(records.get_nowait())
+            except queue.Empty:
+                break
+        lines_by_path: dict = {}
+        for path, line in batch:
+            lines_by_path.setdefault(path, []).append(line)
+        for path, lines in lines_by_path.items():
+            try:
+                _ensure_parent_dir(path)
+                with open(path, "ab") as f:
+                    f.write(b"".join(lines))
+            except OSError as e:
+                logger.warning(f"Record write to {path} failed ({len(lines)} records dropped): {e}")
+        for _ in batch:
+            records.task_done()
+
+@st.cache_resource(show_spinner=False)
+def _get_record_queue() -> queue.Queue:
+    """Queue served by a daemon writer thread, so form submissions never wait on disk I/O."""
+    records: queue.Queue = queue.Queue()
+    threading.Thread(
+        target=_record_writer_loop, args=(records,), name="record-writer", daemon=True
+    ).start()
+    atexit.register(records.join)  # flush pending records on shutdown
+    return records
+
+def _dump_json_line(record: dict) -> bytes:
+    """Compact UTF-8 JSON line; orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+def _append_record(path: str, record: dict) -> None:
+    """Queue one JSON line for append to path; returns without touching the filesystem."""
+    _get_record_queue().put_nowait((path, _dump_json_line(record)))
+
 def store_confession(confession: str, anonymous: bool, name: str = "", email: str = ""):
     """Store confession in a simple way (could be expanded to database)."""
-    import datetime
-    
-    # Create confessions directory if it doesn't exist
-    os.makedirs("confessions", exist_ok=True)
-    
-    # Generate confession entry
-    timestamp = datetime.datetime.now().isoformat()
-    confession_data = {
-        "timestamp": timestamp,
+    _append_record(CONFESSIONS_FILE, {
+        "timestamp": datetime.datetime.now().isoformat(),
         "anonymous": anonymous,
         "confession": confession,
         "name": name if not anonymous else "Anonymous",
-        "email": email if not anonymous else "Hidden"
-    }
-    
-    # Save to file (in production, would use proper database)
-    filename = f"confessions/confession_{timestamp.replace(':', '-')}.txt"
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write(f"=== CONFESSION RECEIVED ===\n")
-        f.write(f"Time: {timestamp}\n")
-        f.write(f"Type: {'Anonymous' if anonymous else 'Open'}\n")
-        if not anonymous:
-            f.write(f"Name: {name}\n")
-            f.write(f"Email: {email}\n")
-        f.write(f"\nMessage:\n{confession}\n")
+        "email": email if not anonymous else "Hidden",
+    })
 
 def render_contact_form(context: str = "general"):
     """Render a contact form for direct messages."""
@@ -289,20 +476,28 @@ def render_contact_form(context: str = "general"):
 
 def store_message(name: str, email: str, subject: str, message: str):
     """Store contact message."""
-    import datetime
-    
-    os.makedirs("messages", exist_ok=True)
-    
-    timestamp = datetime.datetime.now().isoformat()
-    filename = f"messages/message_{timestamp.replace(':', '-')}.txt"
-    
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write(f"=== MESSAGE RECEIVED ===\n")
-        f.write(f"Time: {timestamp}\n")
-        f.write(f"Name: {name}\n")
-        f.write(f"Email: {email}\n")
-        f.write(f"Subject: {subject}\n")
-        f.write(f"\nMessage:\n{message}\n")
+    _append_record(MESSAGES_FILE, {
+        "timestamp": datetime.datetime.now().isoformat(),
+        "name": name,
+        "email": email,
+        "subject": subject,
+        "message": message,
+    })
+
+# User types offered on the landing screen as (label, widget key) pairs
+_USER_TYPE_BUTTONS = tuple((label, f"user_type_{label}") for label in (
+    "🏢 Hiring Manager",
+    "💻 Hiring Manager (Technical Background)",
+    "⚡ Software Developer",
+    "🎲 Just Randomly Ended Up Here",
+    "😍 Looking to Confess You Have a Crush on Noah",
+))
+
+# User types that get a dedicated experience instead of the Q&A chat
+_USER_TYPE_HANDLERS = types.MappingProxyType({
+    "🎲 Just Randomly Ended Up Here": render_casual_visitor_experience,
+    "😍 Looking to Confess You Have a Crush on Noah": render_crush_confession_experience,
+})
 
 # Application Title
 st.title("Noah's AI Assistant 🤖")
@@ -316,38 +511,28 @@ if not st.session_state.user_type:
     st.markdown("### 👋 Hello! I'm Noah's AI Assistant")
     st.markdown("In order for me to best assist you, which best describes you?")
     
-    user_types = [
-        "🏢 Hiring Manager",
-        "💻 Hiring Manager (Technical Background)", 
-        "⚡ Software Developer",
-        "🎲 Just Randomly Ended Up Here",
-        "😍 Looking to Confess You Have a Crush on Noah"
-    ]
-    
-    for user_type in user_types:
-        if st.button(user_type, key=f"user_type_{user_type}", use_container_width=True):
+    for user_type, key in _USER_TYPE_BUTTONS:
+        if st.button(user_type, key=key, use_container_width=True):
             st.session_state.user_type = user_type
             st.rerun()
     
     st.stop()  # Don't show the rest of the interface until user type is selected
 
 # Handle special user types with custom experiences
-if st.session_state.user_type == "🎲 Just Randomly Ended Up Here":
-    render_casual_visitor_experience()
-    st.stop()
-
-elif st.session_state.user_type == "😍 Looking to Confess You Have a Crush on Noah":
-    render_crush_confession_experience()
+_special_experience = _USER_TYPE_HANDLERS.get(st.session_state.user_type)
+if _special_experience:
+    _special_experience()
     st.stop()
 
 # Show personalized welcome message for other user types
+_WELCOMES = types.MappingProxyType({
+    "🏢 Hiring Manager": "Perfect! I'm here to highlight Noah's business impact, leadership potential, and unique career journey. Focus on ROI, team dynamics, and measurable results.",
+    "💻 Hiring Manager (Technical Background)": "Excellent! I can dive deep into Noah's technical stack, architecture decisions, and engineering approach while connecting it to business outcomes.",
+    "⚡ Software Developer": "Great! Let's explore the technical implementation details, code patterns, and engineering decisions behind this AI assistant and Noah's other projects.",
+})
+
 def get_personalized_welcome(user_type: str) -> str:
-    welcomes = {
-        "🏢 Hiring Manager": "Perfect! I'm here to highlight Noah's business impact, leadership potential, and unique career journey. Focus on ROI, team dynamics, and measurable results.",
-        "💻 Hiring Manager (Technical Background)": "Excellent! I can dive deep into Noah's technical stack, architecture decisions, and engineering approach while connecting it to business outcomes.",
-        "⚡ Software Developer": "Great! Let's explore the technical implementation details, code patterns, and engineering decisions behind this AI assistant and Noah's other projects.",
-    }
-    return welcomes.get(user_type, "Welcome! Ask me anything about Noah.")
+    return _WELCOMES.get(user_type, "Welcome! Ask me anything about Noah.")
 
 if st.session_state.user_type:
     st.markdown(f"### {get_personalized_welcome(st.session_state.user_type)}")
@@ -361,62 +546,56 @@ with st.sidebar:
                 del st.session_state["user_question"]
             st.rerun()
 
-# Initialize Configuration
-@st.cache_resource
-def get_config() -> Config:
-    """Get cached configuration instance."""
-    return Config()
-
 @st.cache_resource(show_spinner=False)
-def get_qa_chain():
-    """Initialize and cache the RetrievalQA chain."""
-    try:
-        from langchain_helper import get_qa_chain as _get
-        return _get()
-    except Exception as e:
-        st.error(f"Failed to initialize Q&A system: {e}")
-        st.stop()
+def _start_analytics() -> concurrent.futures.Future:
+    """Open the analytics database once, in a worker thread, so the first render isn't blocked."""
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="analytics-init")
+    future = executor.submit(ChatbotAnalytics)
+    executor.shutdown(wait=False)
+    return future
 
-@st.cache_resource(show_spinner=False)
 def get_analytics() -> ChatbotAnalytics:
-    """Initialize and cache the analytics system."""
-    return ChatbotAnalytics()
+    """Analytics system, waiting for background initialization on first use."""
+    try:
+        return _start_analytics().result()
+    except Exception:
+        _start_analytics.clear()  # retry on the next call instead of caching the failure
+        raise
+
+def analytics_ready() -> bool:
+    """True once the analytics database is open; sidebar sections skip it until then."""
+    return _start_analytics().done()
 
 # Validate Configuration Early
 config = get_config()
 if not config.OPENAI_API_KEY:
     st.error("🔑 OpenAI API key is required. Please add OPENAI_API_KEY to Streamlit Secrets.")
     st.stop()
+_start_analytics()  # overlap database setup with the rest of the render
+
+# Resolve once per run instead of probing the config at every call site
+LINKEDIN_URL: Optional[str] = getattr(config, 'LINKEDIN_URL', None) or None
 
 def render_profile_section(config: Config) -> None:
     """Render the profile section with headshot and LinkedIn integration."""
-    display_name = "Noah"
-    try:
-        display_name = st.secrets.get("HEADSHOT_NAME", display_name)  # type: ignore
-    except Exception:
-        pass
+    display_name, headshot_url = _headshot_settings()
     uploaded = st.file_uploader(
         "Upload headshot (preview only)", type=["png", "jpg", "jpeg"], key="headshot_upload"
     )
     if uploaded is not None:
         st.image(uploaded, width=180, caption=display_name)
+    elif headshot_url:
+        st.image(_headshot_image(headshot_url), width=180, caption=display_name)
     else:
-        headshot_url = None
-        try:
-            headshot_url = st.secrets.get("HEADSHOT_URL")  # type: ignore
-        except Exception:
-            pass
-        if headshot_url:
-            st.image(headshot_url, width=180, caption=display_name)
+        local_headshot = _find_local_headshot()
+        if local_headshot:
+            st.image(local_headshot, width=180, caption=display_name)
         else:
-            local_headshot = _find_local_headshot()
-            if local_headshot:
-                st.image(local_headshot, width=180, caption=display_name)
-            else:
-                st.caption("💡 Tip: Add HEADSHOT_URL to Streamlit Secrets or place noah-headshot.jpg in static/")
+            st.caption("💡 Tip: Add HEADSHOT_URL to Streamlit Secrets or place noah-headshot.jpg in static/")
 
+@st.cache_data(show_spinner=False)
 def _find_local_headshot() -> Optional[str]:
-    """Find local headshot file in static directory."""
+    """Find local headshot file in static directory (scanned once per process)."""
     base_dir = os.path.dirname(__file__)
     for filename in ("noah-headshot.jpg", "noah-headshot.png", "noah-headshot.jpeg"):
         path = os.path.join(base_dir, "static", filename)
@@ -426,11 +605,11 @@ def _find_local_headshot() -> Optional[str]:
 
 def render_linkedin_section(config: Config) -> None:
     """Render LinkedIn profile integration."""
-    if hasattr(config, 'LINKEDIN_URL') and config.LINKEDIN_URL:
+    if LINKEDIN_URL:
         st.markdown("---")
         st.link_button(
             "🔗 LinkedIn Profile",
-            config.LINKEDIN_URL,
+            LINKEDIN_URL,
             help="View Noah's professional background",
             use_container_width=True
         )
@@ -453,34 +632,61 @@ def render_knowledge_base_section() -> None:
     if st.button("🔄 Rebuild FAISS Index", help="Re-embed CSV and rebuild FAISS storage"):
         with st.spinner("Building FAISS index..."):
             try:
-                from langchain_helper import create_vector_db
                 create_vector_db()
-                get_qa_chain.clear()
+                index_exists.clear()
+                _start_qa_chain.clear()
+                get_semantic_cache().clear()
+                _start_sample_warmup.clear()
                 st.success("✅ FAISS index rebuilt successfully")
             except Exception as e:
                 st.error(f"❌ Failed to rebuild index: {e}")
+    # Read-only: the index is shared by every session, so nprobe is the global
+    # FAISS_NPROBE setting applied at load time, never a per-visitor widget
+    if index_exists() and qa_chain_ready():
+        try:
+            nprobe = get_nprobe(get_qa_chain().retriever.vectorstore)
+        except Exception:
+            nprobe = None
+        if nprobe is not None:
+            st.caption(f"🔎 IVF index: {nprobe} cells searched per query (FAISS_NPROBE)")
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_summary() -> dict:
+    """30-day analytics summary, re-queried at most every 30 seconds."""
+    return get_analytics().get_analytics_summary()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fmt_stats(stats_tuple: tuple) -> tuple:
+    """Format (total, career, avg_ms) analytics counters into display strings."""
+    total, career, avg = stats_tuple
+    career_pct = f"{career / total * 100:.0f}%" if total else "0%"
+    return total, career_pct, f"{avg:.0f}ms"
 
 def render_analytics_section() -> None:
     """Render analytics dashboard in sidebar."""
     st.markdown("---")
     st.subheader("📊 Analytics Dashboard")
+    if not analytics_ready():
+        st.caption("⏳ Loading analytics...")
+        return
     try:
-        analytics = get_analytics()
-        stats = analytics.get_analytics_summary()
-        total = stats.get('total_interactions', 0)
+        stats = _cached_summary()
+        total, career_pct, avg_ms = _fmt_stats((
+            stats.get('total_interactions', 0),
+            stats.get('career_questions', 0),
+            stats.get('avg_response_time_ms', 0) or 0,
+        ))
         if total > 0:
             st.metric("Total Questions", total)
             col1, col2 = st.columns(2)
             with col1:
-                career_pct = (stats.get('career_questions', 0) / total) * 100
-                st.metric("Career Focus", f"{career_pct:.0f}%")
+                st.metric("Career Focus", career_pct)
             with col2:
-                avg_ms = stats.get('avg_response_time_ms', 0) or 0
-                st.metric("Avg Response", f"{avg_ms:.0f}ms")
+                st.metric("Avg Response", avg_ms)
             if st.button("📈 Export Data", help="Export analytics to CSV file"):
                 export_path = f"analytics_export_{int(time.time())}.csv"
                 try:
-                    rows = analytics.export_data(export_path)
+                    rows = get_analytics().export_data(export_path)
                     st.success(f"✅ Exported {rows} interactions to {export_path}")
                 except Exception as e:
                     st.error(f"❌ Export failed: {e}")
@@ -496,66 +702,148 @@ def render_diagnostics_section(config: Config) -> None:
     st.write("🔑 OpenAI API Key:", "✅ Present" if config.OPENAI_API_KEY else "❌ Missing")
     st.write("🤖 Embedding Model:", config.OPENAI_EMBEDDING_MODEL)
     try:
-        from langchain_helper import vector_db_exists
-        index_status = "✅ Ready" if vector_db_exists() else "❌ Missing"
+        index_status = "✅ Ready" if index_exists() else "❌ Missing"
     except Exception:
         index_status = "❌ Error"
     st.write("🗃️ FAISS Index:", index_status)
     if st.button("🧪 Test Embeddings", help="Verify OpenAI embedding functionality"):
         try:
-            from langchain_helper import _get_embeddings  # type: ignore
             emb = _get_embeddings()
             vec = emb.embed_query("health check test query")
             st.success(f"✅ Embeddings OK (dim={len(vec)})")
         except Exception as e:
             st.error(f"❌ Embedding test failed: {e}")
 
+SAMPLE_QUESTIONS = (
+    "Walk me through Noah's career so far",
+    "What is Noah's professional background?",
+    "List Noah's top technical skills",
+    "What projects has Noah delivered?",
+    "How can I connect with Noah?",
+)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _popular_questions() -> tuple:
+    """(question, frequency) pairs for the last 30 days, re-queried at most once a minute."""
+    return tuple(
+        (item["question"], item["frequency"])
+        for item in get_analytics().get_popular_questions(limit=5, days=30)
+    )
+
+@st.cache_resource(show_spinner=False)
+def _popular_question_vectors() -> dict:
+    """Popular question text -> normalized (1, d) query vector, filled in the background."""
+    return {}
+
+@st.cache_resource(show_spinner=False)
+def _popular_embed_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Single worker, so overlapping reruns never embed the same question twice."""
+    return concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="popular-embed")
+
+def _embed_popular_questions(questions: tuple, vectors: dict, semantic_cache: SemanticCache) -> None:
+    """Worker: one batched embedding call for the popular questions that have no vector yet."""
+    missing = [q for q in questions if q not in vectors]
+    if not missing:
+        return
+    try:
+        lookups = semantic_cache.lookup_many(missing, _get_embeddings().embed_documents)
+    except Exception as e:
+        logger.warning(f"Popular question embedding failed: {e}")
+        return  # clicks fall back to embedding on demand
+    for question, (_, vec) in zip(missing, lookups):
+        vectors[question] = vec
+    for question in [q for q in vectors if q not in questions]:
+        vectors.pop(question, None)  # only the current list is kept
+
+def _prefetch_popular_vectors(questions: tuple) -> None:
+    """Queue embedding of newly popular questions; clicking one then needs no embedding call."""
+    vectors = _popular_question_vectors()
+    if any(q not in vectors for q in questions):
+        _popular_embed_executor().submit(
+            _embed_popular_questions, questions, vectors, get_semantic_cache()
+        )
+
+def _warm_sample_answers(chain_future: concurrent.futures.Future, semantic_cache: SemanticCache,
+                         generation: int) -> None:
+    """Answer each sample question once and store it in the semantic cache.
+
+    generation is the cache generation when the warmup started; once a rebuild's
+    clear() bumps it, this thread stops and nothing it computed is stored.
+    """
+    try:
+        chain = chain_future.result()  # waits here, off the script thread, for the chain to load
+        lookups = semantic_cache.lookup_many(SAMPLE_QUESTIONS, _get_embeddings().embed_documents)
+    except Exception:
+        return
+    for question, (cached, query_vec) in zip(SAMPLE_QUESTIONS, lookups):
+        if semantic_cache.generation != generation:
+            return  # index rebuilt: answers from this chain would be stale
+        try:
+            if cached is None:
+                result = chain.invoke({"query": question})
+                semantic_cache.add(
+                    query_vec, (result.get("result", ""), result.get("source_documents", [])),
+                    question=question, generation=generation,
+                )
+        except Exception:
+            return  # best-effort: a cold sample still goes through the normal path
+
+@st.cache_resource(show_spinner=False)
+def _start_sample_warmup() -> threading.Thread:
+    """Start warming sample answers in a daemon thread (once per process / index build)."""
+    semantic_cache = get_semantic_cache()
+    thread = threading.Thread(
+        target=_warm_sample_answers,
+        args=(_start_qa_chain(), semantic_cache, semantic_cache.generation),
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+def _use_sample_question() -> None:
+    """Selectbox callback: ask the chosen sample, then reset the picker."""
+    choice = st.session_state.get("sample_choice")
+    if choice:
+        st.session_state["user_question"] = choice
+        st.session_state["sample_choice"] = ""
+
 def render_popular_questions_section() -> None:
     """Render popular questions with fallback to samples."""
     st.markdown("---")
     st.subheader("💡 Popular Questions")
     try:
-        analytics = get_analytics()
-        popular = analytics.get_popular_questions(limit=5, days=30)
+        popular = _popular_questions() if analytics_ready() else ()
         if popular:
+            _prefetch_popular_vectors(tuple(q for q, _ in popular))
             st.caption("Most asked questions (last 30 days):")
-            for i, item in enumerate(popular, 1):
-                question = item['question']
-                frequency = item['frequency']
+            for i, (question, frequency) in enumerate(popular, 1):
                 if st.button(question, key=f"popular_{i}", help=f"Asked {frequency} times"):
                     st.session_state["user_question"] = question
                     st.rerun()
         else:
             st.caption("Sample questions to get you started:")
-            samples = [
-                "Walk me through Noah's career so far",
-                "What is Noah's professional background?",
-                "List Noah's top technical skills",
-                "What projects has Noah delivered?",
-                "How can I connect with Noah?",
-            ]
-            for i, q in enumerate(samples, 1):
-                if st.button(q, key=f"sample_{i}"):
-                    st.session_state["user_question"] = q
-                    st.rerun()
+            st.selectbox(
+                "Sample questions", ("",) + SAMPLE_QUESTIONS, key="sample_choice",
+                label_visibility="collapsed", on_change=_use_sample_question,
+            )
     except Exception as e:
         st.error(f"❌ Unable to load questions: {e}")
 
+@st.cache_data(show_spinner=False)
+def _runtime_versions() -> str:
+    """Installed versions of the RAG stack, probed once per process."""
+    versions = {}
+    for pkg in ['langchain', 'langchain_openai', 'langchain_community', 'faiss']:  # faiss python module name varies
+        try:
+            mod = importlib.import_module(pkg)
+            versions[pkg] = getattr(mod, '__version__', 'n/a')
+        except Exception:
+            pass
+    return ", ".join(f"{k} {v}" for k, v in versions.items())
+
 def render_environment_status():
     """Display runtime environment status (FAISS backend)."""
-    try:
-        import importlib
-        versions = {}
-        for pkg in ['langchain', 'langchain_openai', 'langchain_community', 'faiss']:  # faiss python module name varies
-            try:
-                mod = importlib.import_module(pkg)
-                versions[pkg] = getattr(mod, '__version__', 'n/a')
-            except Exception:
-                pass
-        ver_str = ", ".join(f"{k} {v}" for k, v in versions.items())
-        st.info(f"Runtime: Vector backend FAISS | {ver_str}")
-    except Exception as e:
-        st.warning(f"Environment status unavailable: {e}")
+    st.info(f"Runtime: Vector backend FAISS | {_runtime_versions()}")
 
 # Sidebar
 with st.sidebar:
@@ -569,83 +857,178 @@ with st.sidebar:
 
 # Utility & Processing
 
+class StreamingAnswerHandler(BaseCallbackHandler):
+    """Collect LLM tokens as they arrive; the script thread renders them."""
+
+    run_inline = True  # called on the event loop thread, so it must not touch Streamlit
+
+    def __init__(self) -> None:
+        self.text = ""
+        self.first_token_at: Optional[float] = None
+
+    def on_llm_new_token(self, token: str, **kwargs) -> None:
+        if self.first_token_at is None:
+            self.first_token_at = time.time()
+        self.text += token
+
 def get_session_id() -> str:
     """Get or create a unique session ID for analytics tracking."""
-    if 'session_id' not in st.session_state:
-        st.session_state['session_id'] = str(uuid.uuid4())[:8]
-    return st.session_state['session_id']
+    return st.session_state.setdefault('session_id', secrets.token_hex(4))
+
+CAREER_KEYWORDS = frozenset({
+    "career", "background", "experience", "work", "job", "role",
+    "linkedin", "connect", "history", "resume", "cv", "professional"
+})
+# Single-pass alternation instead of one substring scan per keyword. The leading
+# \b stops matches inside words ("networking", "controlled"); no trailing \b so
+# inflections ("careers", "working") still count.
+_CAREER_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, sorted(CAREER_KEYWORDS))) + ")", re.IGNORECASE
+)
 
 def analyze_question_type(question: str) -> bool:
     """Determine if a question is career-related based on keywords."""
-    career_keywords = [
-        "career", "background", "experience", "work", "job", "role",
-        "linkedin", "connect", "history", "resume", "cv", "professional"
-    ]
-    return any(keyword in question.lower() for keyword in career_keywords)
-
-def render_answer_with_sources(answer: str, sources: List, question: str, config: Config) -> None:
-    """Render the AI answer with professional formatting and source attribution."""
-    st.subheader("💡 Answer")
-    st.write(answer)
-    if analyze_question_type(question) and hasattr(config, 'LINKEDIN_URL') and config.LINKEDIN_URL:
+    return _CAREER_RE.search(question) is not None
+
+def _source_preview(doc) -> str:
+    """Snippet stored at index time, or one computed for indexes built before snippets."""
+    preview = getattr(doc, "metadata", {}).get("snippet")
+    return preview if preview is not None else _make_snippet(getattr(doc, "page_content", ""))
+
+def render_answer_with_sources(answer: str, sources: List, question: str, config: Config,
+                               is_career_related: Optional[bool] = None,
+                               answer_slot=None) -> None:
+    """Render the AI answer with professional formatting and source attribution.
+
+    answer_slot: placeholder the answer was streamed into (heading already shown);
+    the final text replaces the partial one in place instead of rendering again.
+    """
+    if answer_slot is None:
+        st.subheader("💡 Answer")
+        st.write(answer)
+    else:
+        answer_slot.write(answer)
+    if is_career_related is None:
+        is_career_related = analyze_question_type(question)
+    if LINKEDIN_URL and is_career_related:
         st.markdown("---")
         st.info("**💼 For more details about Noah's professional background:**")
         st.link_button(
             "🔗 View LinkedIn Profile",
-            config.LINKEDIN_URL,
+            LINKEDIN_URL,
             help="Connect with Noah and view complete work history"
         )
     if sources:
         with st.expander(f"📚 Sources ({len(sources)} documents)", expanded=False):
-            for i, doc in enumerate(sources, 1):
-                content = getattr(doc, "page_content", "")
-                preview = content[:300] + "..." if len(content) > 300 else content
-                st.markdown(f"**Source {i}:** {preview}")
+            # One markdown element for all previews instead of one per source
+            st.markdown("\n\n".join(
+                f"**Source {i}:** {_source_preview(doc)}" for i, doc in enumerate(sources, 1)
+            ))
+
+def retrieve_by_vector(chain, query_vec) -> List:
+    """Context documents for an already-embedded question, skipping the retriever's own embed call."""
+    retriever = chain.retriever
+    return retriever.vectorstore.similarity_search_by_vector(
+        query_vec[0].tolist(), **retriever.search_kwargs
+    )
+
+async def arun_chain(chain, question: str, callbacks: List, docs: Optional[List] = None) -> dict:
+    """Invoke the QA chain asynchronously, answering from docs when context was pre-retrieved."""
+    if docs is None:
+        return await chain.ainvoke({"query": question}, config={"callbacks": callbacks})
+    output = await chain.combine_documents_chain.ainvoke(
+        {"input_documents": docs, "question": question}, config={"callbacks": callbacks}
+    )
+    return {"result": output.get("output_text", ""), "source_documents": docs}
+
+def _stream_until_done(future: concurrent.futures.Future, handler: StreamingAnswerHandler,
+                       placeholder) -> dict:
+    """Render streamed tokens into placeholder while the chain runs on the event loop."""
+    shown = ""
+    while True:
+        done, _ = concurrent.futures.wait([future], timeout=0.05)
+        if handler.text != shown:
+            shown = handler.text
+            placeholder.markdown(shown + "▌")
+        if done:
+            return future.result()
 
 def process_question(question: str) -> None:
     """Process user question and generate response with full error handling."""
     try:
-        from langchain_helper import vector_db_exists, create_vector_db
-        if not vector_db_exists():
+        if not index_exists():
             with st.spinner("🔄 Building FAISS index (first-time setup)..."):
                 create_vector_db()
+                index_exists.clear()
+                _start_qa_chain.clear()  # drop any build attempted before the index existed
                 st.success("✅ Knowledge base ready!")
         start_time = time.time()
-        # Basic retry loop for transient failures
-        max_attempts = 3
-        backoff_base = 1.5
-        last_error = None
-        for attempt in range(1, max_attempts + 1):
+        analytics = get_analytics()
+        # Exact repeats (no embedding call) and near-duplicates reuse a stored answer, skipping retrieval + LLM.
+        # Transient OpenAI errors are retried by the client itself (OPENAI_MAX_RETRIES, with backoff)
+        semantic_cache = get_semantic_cache()
+        cache_generation = semantic_cache.generation
+        # Popular questions were embedded in one background batch; reuse that vector
+        cached, query_vec = semantic_cache.lookup(question, _popular_question_vectors().get(question))
+        cache_hit = cached is not None
+        ttft_ms: Optional[float] = None
+        answer_slot = None
+        if cache_hit:
+            answer, source_docs = cached
+        else:
+            # Stream tokens into a placeholder under the heading so the answer shows up at
+            # first-token latency; the final text later replaces it in place
+            st.subheader("💡 Answer")
+            answer_slot = stream_slot = st.empty()
+            stream_handler = StreamingAnswerHandler()
+            chain = get_qa_chain()
+            # The lookup already embedded the question: search FAISS with that vector
+            # so a miss costs one embedding round-trip, not two
+            docs = retrieve_by_vector(chain, query_vec)
+            # Network I/O (and the client's transient-error retries) run on the event loop;
+            # this thread only renders
+            future = asyncio.run_coroutine_threadsafe(
+                arun_chain(chain, question, [stream_handler], docs),
+                _get_event_loop(),
+            )
             try:
-                with st.spinner("🤔 Generating response (attempt %d/%d)..." % (attempt, max_attempts)):
-                    chain = get_qa_chain()
-                    analytics = get_analytics()
-                    result = chain.invoke({"query": question})
-                break
-            except Exception as e:
-                last_error = e
-                if attempt < max_attempts:
-                    time.sleep(backoff_base ** attempt)
-                else:
-                    raise
+                with st.spinner("🤔 Generating response..."):
+                    result = _stream_until_done(future, stream_handler, stream_slot)
+            except Exception:
+                stream_slot.empty()
+                raise
+            if stream_handler.first_token_at is not None:
+                ttft_ms = (stream_handler.first_token_at - start_time) * 1000
+            answer = result.get("result", "I apologize, but I couldn't generate a proper response.")
+            source_docs = result.get("source_documents", [])
+            semantic_cache.add(query_vec, (answer, source_docs), question=question,
+                               generation=cache_generation)
         response_time_ms = (time.time() - start_time) * 1000
-        answer = result.get("result", "I apologize, but I couldn't generate a proper response.")
-        source_docs = result.get("source_documents", [])
         is_career_related = analyze_question_type(question)
-        linkedin_included = (
-            hasattr(config, 'LINKEDIN_URL') and config.LINKEDIN_URL and config.LINKEDIN_URL in answer
+        linkedin_included = bool(LINKEDIN_URL and LINKEDIN_URL in answer)
+        render_answer_with_sources(answer, source_docs, question, config, is_career_related,
+                                   answer_slot=answer_slot)
+        cache_note = " (semantic cache hit)" if cache_hit else ""
+        # Perceived latency is time to first token; total generation time is secondary
+        latency_note = (
+            f"First token after {ttft_ms:.0f}ms, full response in {response_time_ms:.0f}ms"
+            if ttft_ms is not None else f"Response generated in {response_time_ms:.0f}ms"
         )
-        analytics.log_interaction(
+        st.caption(f"⚡ {latency_note} using {len(source_docs)} sources{cache_note}")
+        # Logged after rendering: the answer never waits on analytics bookkeeping
+        analytics.queue_interaction(
             question=question,
             answer=answer,
             source_count=len(source_docs),
             response_time_ms=response_time_ms,
             linkedin_included=linkedin_included,
             is_career_related=is_career_related,
+            metadata={"cache_hit": cache_hit, "time_to_first_token_ms": ttft_ms},
             session_id=get_session_id()
         )
-        render_answer_with_sources(answer, source_docs, question, config)
-        st.caption(f"⚡ Response generated in {response_time_ms:.0f}ms using {len(source_docs)} sources")
+        # Keep the sidebar counters live for the next rerun
+        _cached_summary.clear()
+        _popular_questions.clear()
     except Exception as e:
         st.error(f"❌ **Error processing question:** {str(e)}")
         st.info("💡 **Troubleshooting tips:**")
@@ -655,6 +1038,11 @@ def process_question(question: str) -> None:
 
 # Main Question Interface
 render_environment_status()
+try:
+    if index_exists():
+        _start_sample_warmup()  # sample clicks become semantic cache hits
+except Exception:
+    pass
 st.markdown("---")
 st.markdown("### 💬 Ask a Question")
 st.markdown("Ask anything about Noah's background, skills, experience, or projects.")
@@ -664,14 +1052,15 @@ user_question = st.text_input(
     placeholder="e.g., What programming languages does Noah know?",
     help="Ask about Noah's career, technical skills, projects, or background"
 )
-if user_question.strip():
+q = user_question.strip()
+if q:
     # Simple context length safeguard (truncate very long user inputs)
-    if len(user_question) > 1200:
+    if len(q) > 1200:
         st.warning("Question truncated to 1200 characters for processing safety.")
-        user_question = user_question[:1200]
+        q = q[:1200].rstrip()
     if "user_question" in st.session_state:
         del st.session_state["user_question"]
-    process_question(user_question.strip())
+    process_question(q)
 
 
 
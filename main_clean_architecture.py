@@ -8,23 +8,43 @@ for maintainability and clarity.
 """
 
 import streamlit as st
-import os
+import atexit
+import hashlib
+import queue
+import random
 import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
 import logging
+from logging.handlers import QueueHandler, QueueListener
 
 # Import existing working modules
 from config import Config
 from analytics import ChatbotAnalytics
+from langchain_helper import get_qa_chain
 
 # Configure logging for professional monitoring
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+@st.cache_resource
+def _configure_logging() -> QueueListener:
+    """Route log records through a queue so handler I/O happens off the script thread."""
+    log_queue: queue.Queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    )
+    listener = QueueListener(log_queue, stream_handler)
+    root_logger = logging.getLogger()
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(logging.INFO)
+    listener.start()
+    atexit.register(listener.stop)  # flush queued records on shutdown
+    return listener
+
+
+_configure_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -33,15 +53,49 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 class UserType(Enum):
-    """Type-safe enumeration for user types - prevents string errors."""
-    HIRING_MANAGER = "🏢 Hiring Manager"
-    TECHNICAL_HIRING_MANAGER = "💻 Hiring Manager (Technical Background)"
-    SOFTWARE_DEVELOPER = "⚡ Software Developer"
-    CASUAL_VISITOR = "🎲 Just Randomly Ended Up Here"
-    CRUSH_CONFESSOR = "😍 Looking to Confess You Have a Crush on Noah"
+    """Type-safe enumeration for user types - prevents string errors.
+    
+    Each member carries its welcome message, so personalization is a plain
+    attribute access instead of a dict lookup.
+    """
+    HIRING_MANAGER = (
+        "🏢 Hiring Manager",
+        "Perfect! I'm here to highlight Noah's business impact, leadership potential, "
+        "and unique career journey. Focus on ROI, team dynamics, and measurable results."
+    )
+    TECHNICAL_HIRING_MANAGER = (
+        "💻 Hiring Manager (Technical Background)",
+        "Excellent! I can dive deep into Noah's technical stack, architecture decisions, "
+        "and engineering approach while connecting it to business outcomes."
+    )
+    SOFTWARE_DEVELOPER = (
+        "⚡ Software Developer",
+        "Great! Let's explore the technical implementation details, code patterns, "
+        "and engineering decisions behind this AI assistant and Noah's other projects."
+    )
+    CASUAL_VISITOR = (
+        "🎲 Just Randomly Ended Up Here",
+        "Welcome! Let me show you the fun side of who Noah is!"
+    )
+    CRUSH_CONFESSOR = (
+        "😍 Looking to Confess You Have a Crush on Noah",
+        "Aww, that's sweet! Let me help you with that... 😉"
+    )
+    
+    def __new__(cls, label: str, welcome: str) -> 'UserType':
+        member = object.__new__(cls)
+        member._value_ = label  # keep .value as the display label
+        member.welcome = welcome
+        member.help_text = welcome[:100] + "..."  # selector button tooltip
+        return member
+
+
+def question_id(question: str) -> str:
+    """Short stable id for a question, used in widget keys (same across restarts and workers)."""
+    return hashlib.blake2b(question.encode("utf-8"), digest_size=8).hexdigest()
 
 
-@dataclass
+@dataclass(slots=True)
 class UserSession:
     """Data model for user session - demonstrates proper data modeling."""
     session_id: str
@@ -50,45 +104,60 @@ class UserSession:
     
     @classmethod
     def get_or_create(cls) -> 'UserSession':
-        """Factory method for session management."""
-        if "user_session" not in st.session_state:
-            st.session_state.user_session = cls(
-                session_id=str(uuid.uuid4())
-            )
-        return st.session_state.user_session
+        """Factory method for session management.
+        
+        Only primitives live in st.session_state; this builds a fresh view over
+        them. Call save() after changing a field.
+        """
+        state = st.session_state
+        if "session_id" not in state:
+            state.session_id = uuid.uuid4().hex
+            state.user_type_name = None
+            state.questions_asked = 0
+        user_type_name = state.user_type_name
+        return cls(
+            session_id=state.session_id,
+            user_type=UserType[user_type_name] if user_type_name else None,
+            questions_asked=state.questions_asked
+        )
+    
+    def save(self) -> None:
+        """Write the mutable fields back to st.session_state."""
+        st.session_state.user_type_name = self.user_type.name if self.user_type else None
+        st.session_state.questions_asked = self.questions_asked
 
 
 class PersonalizationEngine:
     """Service class for handling user personalization - Single Responsibility Principle."""
     
-    WELCOME_MESSAGES: Dict[UserType, str] = {
-        UserType.HIRING_MANAGER: (
-            "Perfect! I'm here to highlight Noah's business impact, leadership potential, "
-            "and unique career journey. Focus on ROI, team dynamics, and measurable results."
-        ),
-        UserType.TECHNICAL_HIRING_MANAGER: (
-            "Excellent! I can dive deep into Noah's technical stack, architecture decisions, "
-            "and engineering approach while connecting it to business outcomes."
-        ),
-        UserType.SOFTWARE_DEVELOPER: (
-            "Great! Let's explore the technical implementation details, code patterns, "
-            "and engineering decisions behind this AI assistant and Noah's other projects."
-        ),
-        UserType.CASUAL_VISITOR: "Welcome! Let me show you the fun side of who Noah is!",
-        UserType.CRUSH_CONFESSOR: "Aww, that's sweet! Let me help you with that... 😉"
-    }
-    
     @staticmethod
     def get_welcome_message(user_type: UserType) -> str:
         """Get personalized welcome message for user type."""
-        return PersonalizationEngine.WELCOME_MESSAGES.get(
-            user_type, "Welcome! Ask me anything about Noah."
-        )
+        return user_type.welcome
     
-    @staticmethod
-    def is_special_experience(user_type: UserType) -> bool:
+    _SPECIAL_EXPERIENCE_TYPES = frozenset({UserType.CASUAL_VISITOR, UserType.CRUSH_CONFESSOR})
+    
+    @classmethod
+    def is_special_experience(cls, user_type: UserType) -> bool:
         """Check if user type requires special UI flow."""
-        return user_type in [UserType.CASUAL_VISITOR, UserType.CRUSH_CONFESSOR]
+        return user_type in cls._SPECIAL_EXPERIENCE_TYPES
+
+
+SURPRISE_QUESTIONS = (
+    "What's Noah's technical background?",
+    "Tell me about Noah's MMA fighting experience",
+    "What AI projects has Noah worked on?",
+    "How did Noah transition from sales to tech?",
+    "What programming languages does Noah know?",
+    "What's unique about Noah's career journey?",
+    "Can you show me some of Noah's code examples?"
+)
+_RNG = random.Random()
+
+# (user type, widget key, tooltip) for the selector buttons, built once at import
+_USER_TYPE_BUTTONS = tuple(
+    (user_type, f"select_{user_type.name}", user_type.help_text) for user_type in UserType
+)
 
 
 # =============================================================================
@@ -99,9 +168,8 @@ class UserSelectionComponent:
     """Handles user type selection UI - Component pattern."""
     
     @staticmethod
-    def render() -> Optional[UserType]:
+    def render(session: UserSession) -> Optional[UserType]:
         """Render user selection interface and return selected type."""
-        session = UserSession.get_or_create()
         
         if session.user_type:
             return session.user_type
@@ -111,28 +179,29 @@ class UserSelectionComponent:
         st.markdown("In order for me to best assist you, which best describes you?")
         
         # Create buttons for each user type
-        for user_type in UserType:
+        for user_type, key, help_text in _USER_TYPE_BUTTONS:
             if st.button(
                 user_type.value,
-                key=f"select_{user_type.name}",
+                key=key,
                 use_container_width=True,
-                help=PersonalizationEngine.get_welcome_message(user_type)[:100] + "..."
+                help=help_text
             ):
                 session.user_type = user_type
+                session.save()
                 logger.info(f"User selected type: {user_type.value}")
                 st.rerun()
         
         return None
     
     @staticmethod
-    def render_reset_button():
+    def render_reset_button(session: UserSession):
         """Render user type reset functionality in sidebar."""
-        session = UserSession.get_or_create()
         
         if session.user_type:
             with st.sidebar:
                 if st.button("🔄 Change User Type", use_container_width=True):
                     session.user_type = None
+                    session.save()
                     if "user_question" in st.session_state:
                         del st.session_state["user_question"]
                     logger.info("User reset their type selection")
@@ -146,6 +215,7 @@ class ChatInterface:
         """Initialize with dependency injection - testable and maintainable."""
         self.config = config
         self.analytics = analytics
+        self.debug_mode = getattr(config, "debug_mode", False)  # not every Config defines it
     
     def render_question_input(self) -> Optional[str]:
         """Render question input with professional UX."""
@@ -177,21 +247,10 @@ class ChatInterface:
     
     def _get_surprise_question(self) -> str:
         """Get a random interesting question - demonstrates private method organization."""
-        surprise_questions = [
-            "What's Noah's technical background?",
-            "Tell me about Noah's MMA fighting experience",
-            "What AI projects has Noah worked on?",
-            "How did Noah transition from sales to tech?",
-            "What programming languages does Noah know?",
-            "What's unique about Noah's career journey?",
-            "Can you show me some of Noah's code examples?"
-        ]
-        import random
-        return random.choice(surprise_questions)
+        return _RNG.choice(SURPRISE_QUESTIONS)
     
-    def process_question(self, question: str, qa_chain) -> Dict[str, Any]:
+    def process_question(self, question: str, qa_chain, session: UserSession) -> Dict[str, Any]:
         """Process question with proper error handling and monitoring."""
-        session = UserSession.get_or_create()
         
         try:
             with st.spinner("🤔 Thinking..."):
@@ -200,16 +259,18 @@ class ChatInterface:
                 result = qa_chain.invoke({"query": question})
                 response_time = time.time() - start_time
                 
-                # Track analytics
+                # Track analytics (queued; written by the background analytics writer)
                 try:
-                    self.analytics.log_question(
-                        session_id=session.session_id,
-                        user_type=session.user_type.value if session.user_type else "Unknown",
+                    self.analytics.queue_interaction(
                         question=question,
                         answer=result["result"],
-                        response_time=response_time
+                        source_count=len(result.get("source_documents", [])),
+                        response_time_ms=response_time * 1000,
+                        metadata={"user_type": session.user_type.value if session.user_type else "Unknown"},
+                        session_id=session.session_id
                     )
                     session.questions_asked += 1
+                    session.save()
                 except Exception as e:
                     logger.warning(f"Analytics logging failed: {e}")
                 
@@ -233,9 +294,12 @@ class ChatInterface:
         st.markdown(response_data["answer"])
         
         # Debug mode source display
-        if self.config.debug_mode and response_data.get("sources"):
+        if not self.debug_mode:
+            return
+        sources = response_data.get("sources")
+        if sources:
             with st.expander("📚 Sources (Debug Mode)"):
-                for i, source in enumerate(response_data["sources"], 1):
+                for i, source in enumerate(sources, 1):
                     st.markdown(f"**Source {i}:**")
                     content = source.page_content
                     st.text(content[:200] + "..." if len(content) > 200 else content)
@@ -245,6 +309,39 @@ class ChatInterface:
 # SPECIAL EXPERIENCES - Modular Design
 # =============================================================================
 
+# Static page copy, defined once at import rather than inside the renderers
+_CASUAL_CAREER_MD = """
+**Plot twist alert!** 📈
+
+Noah went from:
+- 💪 **Gym sales guy** (learning to persuade people)
+- 🏠 **Real estate** (bigger sales, bigger stakes)  
+- 📦 **Logistics** (keeping stuff moving)
+- ⚡ **Tesla Sales** (now we're talking tech!)
+- 🤖 **AI Engineer** (current plot: building smart assistants)
+
+Oh, and he also had **10 MMA cage fights** along the way because... why not? 🥊
+"""
+
+_CRUSH_QUALITIES_MD = """
+**🔥 The Attractive Qualities:**
+- 💪 **MMA Fighter**: 10 cage fights, championship title holder
+- 🧠 **Smart Career Pivot**: Sales → AI Engineering (strategic thinker!)
+- 🚀 **Self-Driven**: Learned coding and clean architecture
+- 💼 **Business Savvy**: Understands both tech and business sides
+- 🎯 **Goal-Oriented**: Clear 3-year vision, works toward it daily
+"""
+
+_CRUSH_TRAITS_MD = """
+**😊 The Personality Traits:**
+- 🤝 **Great Communicator**: Bridges technical and non-technical teams
+- 💡 **Problem Solver**: Uses design patterns to solve complex challenges
+- 📈 **Growth Mindset**: Constantly learning (like clean architecture!)
+- 🏆 **Competitive**: But in a healthy, motivating way
+- 🌭 **Fun Side**: Can eat 10 hotdogs in one sitting (impressive!)
+"""
+
+
 class SpecialExperienceHandler:
     """Handles special user experiences - demonstrates strategy pattern."""
     
@@ -260,18 +357,7 @@ class SpecialExperienceHandler:
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            st.markdown("""
-            **Plot twist alert!** 📈
-            
-            Noah went from:
-            - 💪 **Gym sales guy** (learning to persuade people)
-            - 🏠 **Real estate** (bigger sales, bigger stakes)  
-            - 📦 **Logistics** (keeping stuff moving)
-            - ⚡ **Tesla Sales** (now we're talking tech!)
-            - 🤖 **AI Engineer** (current plot: building smart assistants)
-            
-            Oh, and he also had **10 MMA cage fights** along the way because... why not? 🥊
-            """)
+            st.markdown(_CASUAL_CAREER_MD)
         
         with col2:
             st.markdown("🖼️ *[Clean architecture makes adding images easy!]*")
@@ -300,24 +386,10 @@ class SpecialExperienceHandler:
         
         col1, col2 = st.columns(2)
         with col1:
-            st.markdown("""
-            **🔥 The Attractive Qualities:**
-            - 💪 **MMA Fighter**: 10 cage fights, championship title holder
-            - 🧠 **Smart Career Pivot**: Sales → AI Engineering (strategic thinker!)
-            - 🚀 **Self-Driven**: Learned coding and clean architecture
-            - 💼 **Business Savvy**: Understands both tech and business sides
-            - 🎯 **Goal-Oriented**: Clear 3-year vision, works toward it daily
-            """)
+            st.markdown(_CRUSH_QUALITIES_MD)
         
         with col2:
-            st.markdown("""
-            **😊 The Personality Traits:**
-            - 🤝 **Great Communicator**: Bridges technical and non-technical teams
-            - 💡 **Problem Solver**: Uses design patterns to solve complex challenges
-            - 📈 **Growth Mindset**: Constantly learning (like clean architecture!)
-            - 🏆 **Competitive**: But in a healthy, motivating way
-            - 🌭 **Fun Side**: Can eat 10 hotdogs in one sitting (impressive!)
-            """)
+            st.markdown(_CRUSH_TRAITS_MD)
         
         st.markdown("---")
         st.markdown("## 💌 Ready to Confess?")
@@ -338,6 +410,48 @@ class SpecialExperienceHandler:
 # APPLICATION ORCHESTRATOR - Main App Class
 # =============================================================================
 
+_ARCHITECTURE_MD = """
+**This application demonstrates professional software engineering:**
+
+- **🎯 Single Responsibility**: Each class has one clear purpose
+- **🔧 Dependency Injection**: Testable and maintainable code
+- **📝 Type Safety**: Comprehensive type hints throughout
+- **⚡ Performance**: Smart caching and lazy initialization
+- **🛡️ Error Handling**: Graceful error recovery with logging
+- **📊 Analytics**: Professional user interaction tracking
+- **🧩 Modularity**: Easy to extend and modify components
+"""
+
+
+@st.cache_data(show_spinner=False)
+def _sidebar_static_markdown(model_name: str) -> tuple:
+    """Sidebar (architecture, about, technical stack) markdown, built once per model name."""
+    architecture_md = """
+This application showcases:
+- **Type-safe enums** for user types
+- **Data models** with dataclasses
+- **Service classes** for business logic
+- **Component pattern** for UI elements
+- **Dependency injection** for testability
+- **Proper error handling** throughout
+"""
+    about_md = """
+Noah's AI assistant with professional features:
+- 🎯 **Career insights** and technical expertise
+- 💻 **Code examples** and architecture discussions
+- 🥊 **MMA background** and personal journey
+- 🚀 **Future goals** in AI and technology
+"""
+    tech_stack_md = f"""
+- **Model**: {model_name}
+- **Framework**: Streamlit + LangChain
+- **Vector Store**: FAISS
+- **Architecture**: Clean Architecture
+- **Patterns**: Dependency Injection, Strategy
+"""
+    return architecture_md, about_md, tech_stack_md
+
+
 class NoahAIAssistantApp:
     """Main application orchestrator - demonstrates clean application structure."""
     
@@ -346,7 +460,7 @@ class NoahAIAssistantApp:
         try:
             self.config = self._get_config()
             self.analytics = self._get_analytics()
-            self.qa_chain = self._get_qa_chain()
+            self.qa_chain_future = self._start_qa_chain()
             self.chat_interface = ChatInterface(self.config, self.analytics)
             self.user_selector = UserSelectionComponent()
             logger.info("Application initialized successfully")
@@ -369,15 +483,28 @@ class NoahAIAssistantApp:
     
     @staticmethod
     @st.cache_resource(show_spinner=False)
-    def _get_qa_chain():
-        """Get cached QA chain with error handling."""
-        from langchain_helper import get_qa_chain
+    def _start_qa_chain() -> Future:
+        """Build the QA chain once, in a worker thread, so the first render isn't blocked."""
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="qa-chain-init")
+        future = executor.submit(get_qa_chain)
+        executor.shutdown(wait=False)
+        return future
+    
+    def _get_qa_chain(self):
+        """Wait for the QA chain with error handling."""
         try:
-            return get_qa_chain()
+            return self.qa_chain_future.result()
         except Exception as e:
             logger.error(f"QA chain initialization failed: {e}")
+            self._start_qa_chain.clear()  # retry on the next rerun instead of caching the failure
             return None
     
+    @staticmethod
+    @st.cache_data(ttl=10, show_spinner=False)
+    def _get_summary_stats(_analytics: ChatbotAnalytics) -> Dict[str, Any]:
+        """Get sidebar usage stats, recomputed at most every 10 seconds."""
+        return _analytics.get_summary_stats()
+    
     def configure_page(self):
         """Configure Streamlit page settings."""
         st.set_page_config(
@@ -394,17 +521,7 @@ class NoahAIAssistantApp:
         
         # Show architecture info
         with st.expander("🏗️ View Clean Architecture Implementation"):
-            st.markdown("""
-            **This application demonstrates professional software engineering:**
-            
-            - **🎯 Single Responsibility**: Each class has one clear purpose
-            - **🔧 Dependency Injection**: Testable and maintainable code
-            - **📝 Type Safety**: Comprehensive type hints throughout
-            - **⚡ Performance**: Smart caching and lazy initialization
-            - **🛡️ Error Handling**: Graceful error recovery with logging
-            - **📊 Analytics**: Professional user interaction tracking
-            - **🧩 Modularity**: Easy to extend and modify components
-            """)
+            st.markdown(_ARCHITECTURE_MD)
     
     def run(self):
         """Main application entry point with clean flow control."""
@@ -413,7 +530,8 @@ class NoahAIAssistantApp:
             self.render_header()
             
             # Handle user selection
-            selected_user_type = self.user_selector.render()
+            session = UserSession.get_or_create()  # one session view per rerun
+            selected_user_type = self.user_selector.render(session)
             
             if not selected_user_type:
                 return  # User still selecting
@@ -429,23 +547,24 @@ class NoahAIAssistantApp:
             elif selected_user_type == UserType.CRUSH_CONFESSOR:
                 SpecialExperienceHandler.render_crush_confessor()
             else:
-                self._handle_regular_chat()
+                self._handle_regular_chat(session)
             
             # Render sidebar components
             self._render_sidebar()
             
             # Render reset button
-            self.user_selector.render_reset_button()
+            self.user_selector.render_reset_button(session)
             
         except Exception as e:
             logger.error(f"Application runtime error: {e}")
             st.error("🚨 An unexpected error occurred. Please refresh the page.")
-            if self.config.debug_mode:
+            if getattr(self.config, "debug_mode", False):
                 st.exception(e)
     
-    def _handle_regular_chat(self):
+    def _handle_regular_chat(self, session: UserSession):
         """Handle regular chat flow for professional user types."""
-        if not self.qa_chain:
+        qa_chain = self._get_qa_chain()
+        if not qa_chain:
             st.error("⚠️ Unable to initialize the AI assistant. Please check the configuration.")
             return
         
@@ -454,63 +573,55 @@ class NoahAIAssistantApp:
         
         if question:
             # Process question
-            response_data = self.chat_interface.process_question(question, self.qa_chain)
+            response_data = self.chat_interface.process_question(question, qa_chain, session)
             
             if response_data:
                 # Display response
                 self.chat_interface.render_response(question, response_data)
                 
                 # Feedback section
-                self._render_feedback_section(question)
+                self._render_feedback_section(question, session)
     
-    def _render_feedback_section(self, question: str):
+    def _render_feedback_section(self, question: str, session: UserSession):
         """Render user feedback section."""
         st.markdown("---")
         st.markdown("#### 💭 Was this helpful?")
         
-        col1, col2, col3, col4, col5 = st.columns(5)
-        
-        feedback_given = False
-        for i, col in enumerate([col1, col2, col3, col4, col5], 1):
-            with col:
-                if st.button("⭐" * i, help=f"Rate {i}/5 stars"):
-                    try:
-                        session = UserSession.get_or_create()
-                        self.analytics.log_feedback(session.session_id, question, i)
-                        st.success("Thanks for the feedback!")
-                        feedback_given = True
-                    except Exception as e:
-                        logger.warning(f"Feedback logging failed: {e}")
-        
-        return feedback_given
+        key = f"feedback_{question_id(question)}"  # per-question, so a new answer starts unrated
+        st.feedback(
+            "stars",
+            key=key,
+            on_change=self._log_feedback,
+            args=(key, session.session_id, question)
+        )
+    
+    def _log_feedback(self, key: str, session_id: str, question: str):
+        """Widget callback: runs before the rerun, so the rating is logged even though
+        the answer (and this widget) is not re-rendered afterwards."""
+        rating = st.session_state.get(key)
+        if rating is None:
+            return
+        try:
+            self.analytics.log_feedback(session_id, question, rating + 1)  # stars are 0-indexed
+            st.toast("Thanks for the feedback!")
+        except Exception as e:
+            logger.warning(f"Feedback logging failed: {e}")
     
     def _render_sidebar(self):
         """Render informational sidebar with analytics."""
         with st.sidebar:
+            architecture_md, about_md, tech_stack_md = _sidebar_static_markdown(self.config.OPENAI_MODEL)
+            
             st.markdown("### 🏗️ Clean Architecture Demo")
-            st.markdown("""
-            This application showcases:
-            - **Type-safe enums** for user types
-            - **Data models** with dataclasses
-            - **Service classes** for business logic
-            - **Component pattern** for UI elements
-            - **Dependency injection** for testability
-            - **Proper error handling** throughout
-            """)
+            st.markdown(architecture_md)
             
             st.markdown("---")
             st.markdown("### 🤖 About This Assistant")
-            st.markdown("""
-            Noah's AI assistant with professional features:
-            - 🎯 **Career insights** and technical expertise
-            - 💻 **Code examples** and architecture discussions
-            - 🥊 **MMA background** and personal journey
-            - 🚀 **Future goals** in AI and technology
-            """)
+            st.markdown(about_md)
             
             # Analytics display
             try:
-                stats = self.analytics.get_summary_stats()
+                stats = self._get_summary_stats(self.analytics)
                 st.markdown("---")
                 st.markdown("### 📊 Usage Stats")
                 st.metric("Total Questions", stats.get("total_questions", 0))
@@ -523,13 +634,7 @@ class NoahAIAssistantApp:
             # Technical details
             st.markdown("---")
             st.markdown("### 🛠️ Technical Stack")
-            st.markdown(f"""
-            - **Model**: {self.config.model_name}
-            - **Framework**: Streamlit + LangChain
-            - **Vector Store**: FAISS
-            - **Architecture**: Clean Architecture
-            - **Patterns**: Dependency Injection, Strategy
-            """)
+            st.markdown(tech_stack_md)
 
 
 # =============================================================================
@@ -17,13 +17,21 @@ Author: Senior Generative AI Applications Engineer
 """
 
 import streamlit as st
+import atexit
+import datetime
+import hashlib
 import os
+import queue
+import random
+import threading
 import time
+import urllib.request
 import uuid
 import logging
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 
 # Import existing working modules (maintains compatibility)
 from config import Config
@@ -35,6 +43,7 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+_RNG = random.Random()  # shared generator for the "Surprise Me" button
 
 
 # =============================================================================
@@ -58,6 +67,18 @@ class UserType(Enum):
     CRUSH_CONFESSOR = "😍 Looking to Confess You Have a Crush on Noah"
 
 
+def question_id(question: str) -> str:
+    """Short stable id for a question, used in widget keys."""
+    return hashlib.blake2b(question.encode("utf-8"), digest_size=8).hexdigest()
+
+
+# (user type, label, widget key, tooltip) for the selector buttons, built once at import
+_USER_TYPE_BUTTONS = tuple(
+    (user_type, user_type.value, f"select_{user_type.name}", f"Select this if you are: {user_type.value}")
+    for user_type in UserType
+)
+
+
 @dataclass
 class UserSession:
     """
@@ -72,7 +93,7 @@ class UserSession:
     session_id: str
     user_type: Optional[UserType] = None
     questions_asked: int = 0
-    start_time: float = time.time()
+    start_time: float = field(default_factory=time.time)
     
     @property
     def session_duration(self) -> float:
@@ -113,18 +134,32 @@ class PersonalizationService:
         UserType.CRUSH_CONFESSOR: "Aww, that's sweet! Let me help you with that... 😉"
     }
     
+    _SPECIAL_FLOW_TYPES = frozenset({UserType.CASUAL_VISITOR, UserType.CRUSH_CONFESSOR})
+    
     @classmethod
     def get_welcome_message(cls, user_type: UserType) -> str:
         """Get personalized welcome message for user type."""
-        return cls.WELCOME_MESSAGES.get(
-            user_type, 
-            "Welcome! Ask me anything about Noah."
-        )
+        return _welcome_message(user_type.value)
     
     @classmethod
     def requires_special_flow(cls, user_type: UserType) -> bool:
         """Check if user type requires special UI flow."""
-        return user_type in [UserType.CASUAL_VISITOR, UserType.CRUSH_CONFESSOR]
+        return _requires_special_flow(user_type.value)
+
+
+@st.cache_data(show_spinner=False)
+def _welcome_message(user_type_value: str) -> str:
+    """Cached welcome message lookup keyed by the enum's string value."""
+    return PersonalizationService.WELCOME_MESSAGES.get(
+        UserType(user_type_value),
+        "Welcome! Ask me anything about Noah."
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _requires_special_flow(user_type_value: str) -> bool:
+    """Cached special-flow check keyed by the enum's string value."""
+    return UserType(user_type_value) in PersonalizationService._SPECIAL_FLOW_TYPES
 
 
 class SessionManager:
@@ -140,11 +175,12 @@ class SessionManager:
     @staticmethod
     def get_session() -> UserSession:
         """Get or create user session (Singleton pattern)."""
-        if "user_session" not in st.session_state:
-            st.session_state.user_session = UserSession(
-                session_id=str(uuid.uuid4())
+        session = st.session_state.get("user_session")
+        if session is None:  # one state lookup on the hot path
+            session = st.session_state.user_session = UserSession(
+                session_id=uuid.uuid4().hex
             )
-        return st.session_state.user_session
+        return session
     
     @staticmethod
     def reset_session():
@@ -153,6 +189,8 @@ class SessionManager:
             del st.session_state.user_session
         if "user_question" in st.session_state:
             del st.session_state["user_question"]
+        for key in [k for k in st.session_state if k.startswith(("feedback_", "fb_logged_"))]:
+            del st.session_state[key]
         logger.info("User session reset")
 
 
@@ -163,34 +201,82 @@ class FileStorageService:
     Benefits:
     - Proper error handling
     - Directory management
+    - Non-blocking submits: store_* only queue the file, a background
+      writer thread does the disk I/O (True means "accepted", not "on disk")
     - Extensible for different storage backends
     """
     
+    WRITE_QUEUE_SIZE = 1024
+    
     @staticmethod
+    @st.cache_resource(show_spinner=False)
     def ensure_directory(path: str):
-        """Ensure directory exists, create if not."""
-        os.makedirs(path, exist_ok=True)
+        """Ensure directory exists, create if not (once per path per process)."""
+        Path(path).mkdir(parents=True, exist_ok=True)
+    
+    @staticmethod
+    @st.cache_resource
+    def _get_write_queue() -> queue.Queue:
+        """Start the background file writer once per process and return its queue."""
+        write_queue: queue.Queue = queue.Queue(maxsize=FileStorageService.WRITE_QUEUE_SIZE)
+        threading.Thread(
+            target=FileStorageService._writer_loop, args=(write_queue,),
+            name="file-storage-writer", daemon=True
+        ).start()
+        atexit.register(write_queue.join)  # drain pending submissions on shutdown
+        return write_queue
+    
+    @staticmethod
+    def _writer_loop(write_queue: queue.Queue):
+        """Write queued (filename, body) pairs off the request thread."""
+        while True:
+            filename, body = write_queue.get()
+            try:
+                # One raw write of the whole payload, then an atomic rename into place
+                tmp_path = f"{filename}.tmp"
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    os.write(fd, body.encode('utf-8'))
+                finally:
+                    os.close(fd)
+                os.replace(tmp_path, filename)
+            except Exception as e:
+                logger.error(f"Failed to write {filename}: {e}")
+            finally:
+                write_queue.task_done()
+    
+    @staticmethod
+    def _enqueue_write(filename: str, body: str) -> bool:
+        """Hand a file to the background writer; drops it if the queue is full."""
+        try:
+            FileStorageService._get_write_queue().put_nowait((filename, body))
+            return True
+        except queue.Full:
+            logger.warning(f"File write queue full, dropping {filename}")
+            return False
     
     @staticmethod
     def store_confession(confession: str, anonymous: bool = True, 
                         name: str = "", email: str = "") -> bool:
-        """Store confession with proper error handling."""
+        """Queue confession for storage with proper error handling."""
         try:
             FileStorageService.ensure_directory("confessions")
             
-            import datetime
-            timestamp = datetime.datetime.now().isoformat()
-            filename = f"confessions/confession_{timestamp.replace(':', '-')}.txt"
+            now = datetime.datetime.now()
+            timestamp = now.isoformat()
+            filename = now.strftime("confessions/confession_%Y-%m-%dT%H-%M-%S.%f.txt")
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(f"=== CONFESSION RECEIVED ===\n")
-                f.write(f"Time: {timestamp}\n")
-                f.write(f"Type: {'Anonymous' if anonymous else 'Open'}\n")
-                if not anonymous:
-                    f.write(f"Name: {name}\n")
-                    f.write(f"Email: {email}\n")
-                f.write(f"\nMessage:\n{confession}\n")
+            contact = "" if anonymous else f"Name: {name}\nEmail: {email}\n"
+            body = (
+                f"=== CONFESSION RECEIVED ===\n"
+                f"Time: {timestamp}\n"
+                f"Type: {'Anonymous' if anonymous else 'Open'}\n"
+                f"{contact}"
+                f"\nMessage:\n{confession}\n"
+            )
             
+            if not FileStorageService._enqueue_write(filename, body):
+                return False
             logger.info(f"Confession stored: {'anonymous' if anonymous else 'open'}")
             return True
             
@@ -200,22 +286,25 @@ class FileStorageService:
     
     @staticmethod
     def store_message(name: str, email: str, subject: str, message: str) -> bool:
-        """Store contact message with error handling."""
+        """Queue contact message for storage with error handling."""
         try:
             FileStorageService.ensure_directory("messages")
             
-            import datetime
-            timestamp = datetime.datetime.now().isoformat()
-            filename = f"messages/message_{timestamp.replace(':', '-')}.txt"
+            now = datetime.datetime.now()
+            timestamp = now.isoformat()
+            filename = now.strftime("messages/message_%Y-%m-%dT%H-%M-%S.%f.txt")
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(f"=== MESSAGE RECEIVED ===\n")
-                f.write(f"Time: {timestamp}\n")
-                f.write(f"Name: {name}\n")
-                f.write(f"Email: {email}\n")
-                f.write(f"Subject: {subject}\n")
-                f.write(f"\nMessage:\n{message}\n")
+            body = (
+                f"=== MESSAGE RECEIVED ===\n"
+                f"Time: {timestamp}\n"
+                f"Name: {name}\n"
+                f"Email: {email}\n"
+                f"Subject: {subject}\n"
+                f"\nMessage:\n{message}\n"
+            )
             
+            if not FileStorageService._enqueue_write(filename, body):
+                return False
             logger.info(f"Message stored from: {name}")
             return True
             
@@ -244,12 +333,12 @@ class UserSelectionUI:
         st.markdown("In order for me to best assist you, which best describes you?")
         
         # Create elegant button layout
-        for user_type in UserType:
+        for user_type, label, key, help_text in _USER_TYPE_BUTTONS:
             if st.button(
-                user_type.value,
-                key=f"select_{user_type.name}",
+                label,
+                key=key,
                 use_container_width=True,
-                help=f"Select this if you are: {user_type.value}"
+                help=help_text
             ):
                 session.user_type = user_type
                 logger.info(f"User selected: {user_type.value}")
@@ -272,18 +361,20 @@ class UserSelectionUI:
 class ChatInterfaceUI:
     """Professional chat interface with analytics integration."""
     
+    SURPRISE_QUESTIONS = (
+        "What's Noah's technical background?",
+        "Tell me about Noah's MMA fighting experience",
+        "What AI projects has Noah worked on?",
+        "How did Noah transition from sales to tech?",
+        "What programming languages does Noah know?",
+        "What's unique about Noah's career journey?",
+        "Can you show me some of Noah's code examples?"
+    )
+    
     def __init__(self, config: Config, analytics: ChatbotAnalytics):
         self.config = config
         self.analytics = analytics
-        self.surprise_questions = [
-            "What's Noah's technical background?",
-            "Tell me about Noah's MMA fighting experience", 
-            "What AI projects has Noah worked on?",
-            "How did Noah transition from sales to tech?",
-            "What programming languages does Noah know?",
-            "What's unique about Noah's career journey?",
-            "Can you show me some of Noah's code examples?"
-        ]
+        self.debug_mode = getattr(config, "debug_mode", False)  # not every Config defines it
     
     def render_question_input(self) -> Optional[str]:
         """Render question input with improved UX."""
@@ -303,46 +394,53 @@ class ChatInterfaceUI:
             ask_button = st.button("🚀 Ask", use_container_width=True)
         
         with col3:
-            surprise_button = st.button("🎲 Surprise Me", use_container_width=True)
-        
-        # Handle surprise question
-        if surprise_button:
-            import random
-            selected_question = random.choice(self.surprise_questions)
-            st.session_state.user_question = selected_question
-            return selected_question
+            st.button("🎲 Surprise Me", use_container_width=True, on_click=self._pick_surprise)
         
-        # Handle normal question
-        if ask_button and question.strip():
+        # Ask on click, or straight away when the question came from "Surprise Me"
+        surprise_pending = st.session_state.pop("surprise_pending", False)
+        if (ask_button or surprise_pending) and question.strip():
             return question.strip()
         
         return None
     
+    def _pick_surprise(self):
+        """Surprise button callback: fill the input before it is rendered this run."""
+        st.session_state.user_question = _RNG.choice(self.SURPRISE_QUESTIONS)
+        st.session_state.surprise_pending = True
+    
     def process_and_display_response(self, question: str, qa_chain) -> bool:
         """Process question and display response with error handling."""
         session = SessionManager.get_session()
+        qid = question_id(question)
         
         try:
-            with st.spinner("🤔 Thinking..."):
+            # One slot holds the spinner, then is replaced in place by the answer
+            response_slot = st.empty()
+            with response_slot.container(), st.spinner("🤔 Thinking..."):
                 start_time = time.time()
                 
                 # Get response
-                result = qa_chain.invoke({"query": question})
+                if self.debug_mode:
+                    result = qa_chain.invoke({"query": question})  # always fresh in debug mode
+                else:
+                    result = _cached_invoke(qa_chain, " ".join(question.lower().split()), question)
                 response_time = time.time() - start_time
-                
-                # Display response
+            
+            # Display response
+            with response_slot.container():
                 self._display_response(question, result, response_time)
-                
-                # Track analytics (with error handling)
-                self._track_interaction(session, question, result["result"], response_time)
-                
-                # Render feedback
-                return self._render_feedback(session, question)
+            
+            # Track analytics (with error handling)
+            self._track_interaction(session, question, result["result"], response_time)
+            
+            # Render feedback
+            self._render_feedback(session, question, qid)
+            return True
                 
         except Exception as e:
             logger.error(f"Question processing failed: {e}")
             st.error("🚨 Sorry, I encountered an error processing your question. Please try again.")
-            if self.config.debug_mode:
+            if self.debug_mode:
                 st.exception(e)
             return False
     
@@ -355,7 +453,7 @@ class ChatInterfaceUI:
         st.markdown(result["result"])
         
         # Debug information
-        if self.config.debug_mode:
+        if self.debug_mode:
             with st.expander("🐛 Debug Information"):
                 st.metric("Response Time", f"{response_time:.2f}s")
                 if "source_documents" in result:
@@ -365,51 +463,211 @@ class ChatInterfaceUI:
     
     def _track_interaction(self, session: UserSession, question: str, 
                           answer: str, response_time: float):
-        """Track interaction with proper error handling."""
+        """Track interaction with proper error handling (batched by the analytics writer)."""
         try:
-            self.analytics.log_question(
-                session_id=session.session_id,
-                user_type=session.user_type.value if session.user_type else "Unknown",
+            self.analytics.queue_interaction(
                 question=question,
                 answer=answer,
-                response_time=response_time
+                response_time_ms=response_time * 1000,
+                metadata={"user_type": session.user_type.value if session.user_type else "Unknown"},
+                session_id=session.session_id
             )
             session.questions_asked += 1
+            # flush() wakes the writer to commit now (sub-millisecond INSERT batch), so
+            # the popular-questions fragment later in this run re-caches fresh data
+            # instead of pinning the pre-insert rows for 30s
+            self.analytics.flush()
+            _cached_summary_stats.clear()
+            _cached_popular_questions.clear()
         except Exception as e:
             logger.warning(f"Analytics tracking failed: {e}")
     
-    def _render_feedback(self, session: UserSession, question: str) -> bool:
+    def _render_feedback(self, session: UserSession, question: str, qid: str):
         """Render feedback section with analytics tracking."""
-        st.markdown("---")
-        st.markdown("#### 💭 Was this helpful?")
-        
-        col1, col2, col3, col4, col5 = st.columns(5)
-        
-        for i, col in enumerate([col1, col2, col3, col4, col5], 1):
-            with col:
-                if st.button("⭐" * i, help=f"Rate {i}/5 stars", key=f"rating_{i}"):
-                    try:
-                        self.analytics.log_feedback(session.session_id, question, i)
-                        st.success(f"Thanks for the feedback! ({i}/5 stars)")
-                        return True
-                    except Exception as e:
-                        logger.warning(f"Feedback logging failed: {e}")
-        
-        return False
+        _feedback_fragment(self.analytics, session.session_id, question, qid)
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_invoke(_qa_chain, normalized_question: str, _raw_question: str) -> Dict[str, Any]:
+    """Answer a question, reusing the result for repeats of the same normalized text.
+
+    Only the normalized text is part of the cache key; the model sees the question
+    as typed, so casing in proper nouns and acronyms ("AWS", "iOS") is preserved.
+    """
+    return _qa_chain.invoke({"query": _raw_question})
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_summary_stats(_analytics: ChatbotAnalytics) -> Dict[str, Any]:
+    """Sidebar usage stats, recomputed at most every 30 seconds."""
+    return _analytics.get_summary_stats()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_popular_questions(_analytics: ChatbotAnalytics, limit: int) -> List[Tuple[str, str]]:
+    """Most-asked questions as (button label, question), recomputed at most every 30 seconds."""
+    return [
+        (f"{i}. {item['question']} ({item['frequency']} times asked)", item["question"])
+        for i, item in enumerate(_analytics.get_popular_questions(limit=limit), 1)
+    ]
+
+
+@st.fragment
+def _feedback_fragment(analytics: ChatbotAnalytics, session_id: str, question: str, qid: str):
+    """Star rating as a fragment: a click reruns only this block, not the whole app
+    (which would drop the answer, since it only renders right after "Ask")."""
+    st.markdown("---\n\n#### 💭 Was this helpful?")
+    
+    rating = st.feedback(
+        "stars",
+        key=f"feedback_{qid}",  # per-question, so a new answer starts unrated
+        on_change=_log_feedback,
+        args=(analytics, qid, session_id, question),
+    )
+    if rating is not None:
+        st.success(f"Thanks for the feedback! ({rating + 1}/5 stars)")
+
+
+def _log_feedback(analytics: ChatbotAnalytics, qid: str, session_id: str, question: str):
+    """st.feedback callback: logs once per distinct rating (stars are 0-indexed)."""
+    rating = st.session_state.get(f"feedback_{qid}")
+    logged_key = f"fb_logged_{qid}"
+    if rating is None or st.session_state.get(logged_key) == rating:
+        return
+    try:
+        analytics.log_feedback(session_id, question, rating + 1)
+        st.session_state[logged_key] = rating
+    except Exception as e:
+        logger.warning(f"Feedback logging failed: {e}")
+
+
+@st.fragment
+def _popular_questions_fragment(analytics: ChatbotAnalytics):
+    """Popular questions as a fragment; picking one triggers a full app rerun."""
+    try:
+        popular_questions = _cached_popular_questions(analytics, 5)
+        if popular_questions:
+            st.markdown("---")
+            st.markdown("### 🔥 Popular Questions")
+            st.markdown("*Click on any question to ask it:*")
+            
+            for i, (label, question) in enumerate(popular_questions, 1):
+                if st.button(
+                    label,
+                    key=f"popular_{i}",
+                    help="Click to ask this question"
+                ):
+                    st.session_state.user_question = question
+                    st.rerun()
+    except Exception as e:
+        logger.warning(f"Failed to load popular questions: {e}")
 
 
 # =============================================================================
 # SPECIAL EXPERIENCE HANDLERS
 # =============================================================================
 
+# Static page copy, defined once at import rather than inside the renderers
+# Sequential markdown calls are merged so each section is a single delta message
+_CASUAL_INTRO_MD = (
+    "# 🎲 Welcome, Random Visitor! 👋\n\n"
+    "Since you just stumbled upon this, let me give you the fun tour of who Noah is!"
+)
+
+_CAREER_JOURNEY_MD = """
+**Plot twist alert!** 📈
+
+Noah went from:
+- 💪 **Gym sales guy** (learning to persuade people)
+- 🏠 **Real estate** (bigger sales, bigger stakes)  
+- 📦 **Logistics** (keeping stuff moving)
+- ⚡ **Tesla Sales** (now we're talking tech!)
+- 🤖 **AI Engineer** (current plot: building smart assistants)
+
+Oh, and he also had **10 MMA cage fights** along the way because... why not? 🥊
+"""
+
+_MMA_HIGHLIGHTS_MD = (
+    "---\n\n"
+    "## 🥊 MMA Highlights - The Good Stuff!\n\n"
+    "**10 cage fights, amateur & professional. Here's the crown jewel:**\n\n"
+    "### 🏆 Title Fight Victory\n\n"
+    "Noah defeated 5-0 fighter Edgar Sorto to win the **Fierce Fighting Championship amateur 135-lb title**!"
+)
+
+_FUN_FACTS_MD = "---\n\n## 🌟 Random Fun Facts\n\n" + "\n".join(f"- {fact}" for fact in (
+    "🌭 Can eat 10 hotdogs in one sitting (verified!)",
+    "🧠 Got into AI after watching AlphaZero demolish Stockfish in 2017",
+    "💻 Went from zero coding to building this AI assistant in months",
+    "🎯 Chose Tesla as a 'bridge job' to transition from sales to tech",
+    "🤖 Uses GitHub Copilot and Claude to accelerate development (smart, not lazy!)"
+))
+
+_CRUSH_QUALITIES_MD = """
+**🔥 The Attractive Qualities:**
+- 💪 **MMA Fighter**: 10 cage fights, championship title holder
+- 🧠 **Smart Career Pivot**: Sales → AI Engineering (strategic thinker!)
+- 🚀 **Self-Driven**: Learned coding and built this AI assistant
+- 💼 **Business Savvy**: Understands both tech and business sides
+- 🎯 **Goal-Oriented**: Clear 3-year vision, works toward it daily
+"""
+
+_CRUSH_TRAITS_MD = """
+**😊 The Personality Traits:**
+- 🤝 **Great Communicator**: Bridges technical and non-technical teams
+- 💡 **Problem Solver**: Finds creative solutions to complex challenges
+- 📈 **Growth Mindset**: Constantly learning and improving
+- 🏆 **Competitive**: But in a healthy, motivating way
+- 🌭 **Fun Side**: Can eat 10 hotdogs in one sitting (impressive!)
+"""
+
+_CRUSH_INTRO_MD = (
+    "# 😍 Aww, That's So Sweet! 💕\n\n"
+    "Someone has a crush on Noah! Let me help you with that... 😉"
+)
+
+_CONFESS_PROMPT_MD = (
+    "---\n\n"
+    "## 💌 Ready to Confess?\n\n"
+    "**Would you like to confess anonymously or openly?**"
+)
+
+_ANONYMOUS_CONFESSION_MD = (
+    "---\n\n"
+    "### 🕶️ Anonymous Confession\n\n"
+    "*Your identity will remain completely private!*"
+)
+
+_OPEN_CONFESSION_MD = (
+    "---\n\n"
+    "### 😊 Open Confession\n\n"
+    "*Let Noah know who you are!*"
+)
+
+
+@st.cache_data(show_spinner=False)
+def _get_headshot_url() -> Optional[str]:
+    """HEADSHOT_URL from Streamlit secrets, read once per process."""
+    try:
+        return st.secrets.get("HEADSHOT_URL")
+    except FileNotFoundError:  # no secrets.toml configured
+        return None
+
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _fetch_image_bytes(url: str) -> bytes:
+    """Download a remote image once a day instead of on every rerun."""
+    with urllib.request.urlopen(url, timeout=5) as response:
+        return response.read()
+
+
 class CasualVisitorExperience:
     """Handles casual visitor experience with improved organization."""
     
     @staticmethod
     def render():
         """Render complete casual visitor experience."""
-        st.markdown("# 🎲 Welcome, Random Visitor! 👋")
-        st.markdown("Since you just stumbled upon this, let me give you the fun tour of who Noah is!")
+        st.markdown(_CASUAL_INTRO_MD)
         
         CasualVisitorExperience._render_career_journey()
         CasualVisitorExperience._render_mma_highlights()
@@ -424,38 +682,25 @@ class CasualVisitorExperience:
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            st.markdown("""
-            **Plot twist alert!** 📈
-            
-            Noah went from:
-            - 💪 **Gym sales guy** (learning to persuade people)
-            - 🏠 **Real estate** (bigger sales, bigger stakes)  
-            - 📦 **Logistics** (keeping stuff moving)
-            - ⚡ **Tesla Sales** (now we're talking tech!)
-            - 🤖 **AI Engineer** (current plot: building smart assistants)
-            
-            Oh, and he also had **10 MMA cage fights** along the way because... why not? 🥊
-            """)
+            st.markdown(_CAREER_JOURNEY_MD)
         
         with col2:
-            try:
-                headshot_url = st.secrets.get("HEADSHOT_URL")
-                if headshot_url:
-                    st.image(headshot_url, width=200, caption="The man himself! 😄")
-                else:
-                    st.markdown("🖼️ *[Noah's photo would go here]*")
-            except:
+            headshot = None
+            headshot_url = _get_headshot_url()
+            if headshot_url:
+                try:
+                    headshot = _fetch_image_bytes(headshot_url)
+                except (OSError, ValueError) as e:  # failures are not cached; next rerun retries
+                    logger.warning(f"Headshot download failed: {e}")
+            if headshot:
+                st.image(headshot, width=200, caption="The man himself! 😄")
+            else:
                 st.markdown("🖼️ *[Noah's photo would go here]*")
     
     @staticmethod
     def _render_mma_highlights():
         """Render MMA highlights section."""
-        st.markdown("---")
-        st.markdown("## 🥊 MMA Highlights - The Good Stuff!")
-        st.markdown("**10 cage fights, amateur & professional. Here's the crown jewel:**")
-        
-        st.markdown("### 🏆 Title Fight Victory")
-        st.markdown("Noah defeated 5-0 fighter Edgar Sorto to win the **Fierce Fighting Championship amateur 135-lb title**!")
+        st.markdown(_MMA_HIGHLIGHTS_MD)
         
         video_url = "https://www.youtube.com/watch?v=MgcAdEoJMzg"
         st.video(video_url)
@@ -465,19 +710,7 @@ class CasualVisitorExperience:
     @staticmethod
     def _render_fun_facts():
         """Render fun facts section."""
-        st.markdown("---")
-        st.markdown("## 🌟 Random Fun Facts")
-        
-        fun_facts = [
-            "🌭 Can eat 10 hotdogs in one sitting (verified!)",
-            "🧠 Got into AI after watching AlphaZero demolish Stockfish in 2017",
-            "💻 Went from zero coding to building this AI assistant in months",
-            "🎯 Chose Tesla as a 'bridge job' to transition from sales to tech",
-            "🤖 Uses GitHub Copilot and Claude to accelerate development (smart, not lazy!)"
-        ]
-        
-        for fact in fun_facts:
-            st.markdown(f"- {fact}")
+        st.markdown(_FUN_FACTS_MD)
     
     @staticmethod
     def _render_contact_section():
@@ -522,10 +755,10 @@ class CasualVisitorExperience:
             submitted = st.form_submit_button("📤 Send Message")
             
             if submitted:
-                if all([name.strip(), email.strip(), subject.strip(), message.strip()]):
-                    success = FileStorageService.store_message(
-                        name.strip(), email.strip(), subject.strip(), message.strip()
-                    )
+                name, email = name.strip(), email.strip()
+                subject, message = subject.strip(), message.strip()
+                if name and email and subject and message:
+                    success = FileStorageService.store_message(name, email, subject, message)
                     if success:
                         st.success("✅ Message sent to Noah! He'll get back to you soon.")
                         st.session_state.show_contact_form = False
@@ -548,8 +781,7 @@ class CrushConfessionExperience:
     @staticmethod
     def render():
         """Render complete crush confession experience."""
-        st.markdown("# 😍 Aww, That's So Sweet! 💕")
-        st.markdown("Someone has a crush on Noah! Let me help you with that... 😉")
+        st.markdown(_CRUSH_INTRO_MD)
         
         CrushConfessionExperience._render_attractive_qualities()
         CrushConfessionExperience._render_confession_options()
@@ -562,31 +794,15 @@ class CrushConfessionExperience:
         col1, col2 = st.columns(2)
         
         with col1:
-            st.markdown("""
-            **🔥 The Attractive Qualities:**
-            - 💪 **MMA Fighter**: 10 cage fights, championship title holder
-            - 🧠 **Smart Career Pivot**: Sales → AI Engineering (strategic thinker!)
-            - 🚀 **Self-Driven**: Learned coding and built this AI assistant
-            - 💼 **Business Savvy**: Understands both tech and business sides
-            - 🎯 **Goal-Oriented**: Clear 3-year vision, works toward it daily
-            """)
+            st.markdown(_CRUSH_QUALITIES_MD)
         
         with col2:
-            st.markdown("""
-            **😊 The Personality Traits:**
-            - 🤝 **Great Communicator**: Bridges technical and non-technical teams
-            - 💡 **Problem Solver**: Finds creative solutions to complex challenges
-            - 📈 **Growth Mindset**: Constantly learning and improving
-            - 🏆 **Competitive**: But in a healthy, motivating way
-            - 🌭 **Fun Side**: Can eat 10 hotdogs in one sitting (impressive!)
-            """)
+            st.markdown(_CRUSH_TRAITS_MD)
     
     @staticmethod
     def _render_confession_options():
         """Render confession options and forms."""
-        st.markdown("---")
-        st.markdown("## 💌 Ready to Confess?")
-        st.markdown("**Would you like to confess anonymously or openly?**")
+        st.markdown(_CONFESS_PROMPT_MD)
         
         col1, col2 = st.columns(2)
         
@@ -609,9 +825,7 @@ class CrushConfessionExperience:
     @staticmethod
     def _render_anonymous_confession():
         """Render anonymous confession form."""
-        st.markdown("---")
-        st.markdown("### 🕶️ Anonymous Confession")
-        st.markdown("*Your identity will remain completely private!*")
+        st.markdown(_ANONYMOUS_CONFESSION_MD)
         
         confession = st.text_area(
             "Share your feelings:",
@@ -631,9 +845,7 @@ class CrushConfessionExperience:
     @staticmethod
     def _render_open_confession():
         """Render open confession form."""
-        st.markdown("---")
-        st.markdown("### 😊 Open Confession")
-        st.markdown("*Let Noah know who you are!*")
+        st.markdown(_OPEN_CONFESSION_MD)
         
         with st.form("open_confession_form"):
             col1, col2 = st.columns(2)
@@ -653,16 +865,14 @@ class CrushConfessionExperience:
             submitted = st.form_submit_button("💌 Send Open Confession")
             
             if submitted:
-                if not all([name.strip(), email.strip(), confession.strip()]):
+                name, email, confession = name.strip(), email.strip(), confession.strip()
+                if not (name and email and confession):
                     st.error("Please fill in all fields!")
                 elif not consent:
                     st.error("Please confirm your consent to share contact information.")
                 else:
                     success = FileStorageService.store_confession(
-                        confession.strip(), 
-                        anonymous=False, 
-                        name=name.strip(), 
-                        email=email.strip()
+                        confession, anonymous=False, name=name, email=email
                     )
                     
                     if success:
@@ -685,7 +895,6 @@ class NoahAIAssistantApp:
             # Initialize dependencies with error handling
             self.config = self._get_config()
             self.analytics = self._get_analytics()
-            self.qa_chain = self._get_qa_chain()
             self.chat_ui = ChatInterfaceUI(self.config, self.analytics)
             
             logger.info("Application initialized successfully")
@@ -710,13 +919,9 @@ class NoahAIAssistantApp:
     @staticmethod
     @st.cache_resource(show_spinner=False)
     def _get_qa_chain():
-        """Get cached QA chain with proper error handling."""
-        try:
-            from langchain_helper import get_qa_chain
-            return get_qa_chain()
-        except Exception as e:
-            logger.error(f"QA chain initialization failed: {e}")
-            return None
+        """Get cached QA chain. Failures raise, so they are not cached and the next rerun retries."""
+        from langchain_helper import get_qa_chain
+        return get_qa_chain()
     
     def configure_page(self):
         """Configure Streamlit page with professional settings."""
@@ -759,7 +964,7 @@ class NoahAIAssistantApp:
             
             # Display analytics
             try:
-                stats = self.analytics.get_summary_stats()
+                stats = _cached_summary_stats(self.analytics)
                 st.markdown("---")
                 st.markdown("### 📊 Usage Stats")
                 st.metric("Total Questions", stats.get("total_questions", 0))
@@ -821,7 +1026,12 @@ class NoahAIAssistantApp:
     
     def _handle_chat_flow(self):
         """Handle regular chat flow with error checking."""
-        if not self.qa_chain:
+        # Resolved here rather than in __init__ so casual and crush visitors
+        # never import langchain_helper
+        try:
+            qa_chain = self._get_qa_chain()
+        except Exception as e:
+            logger.error(f"QA chain initialization failed: {e}")
             st.error("⚠️ Unable to initialize the AI assistant. Please check the configuration.")
             return
         
@@ -830,30 +1040,14 @@ class NoahAIAssistantApp:
         
         if question:
             # Process and display response
-            self.chat_ui.process_and_display_response(question, self.qa_chain)
+            self.chat_ui.process_and_display_response(question, qa_chain)
             
             # Show popular questions
             self._render_popular_questions()
     
     def _render_popular_questions(self):
         """Render popular questions section."""
-        try:
-            popular_questions = self.analytics.get_popular_questions(limit=5)
-            if popular_questions:
-                st.markdown("---")
-                st.markdown("### 🔥 Popular Questions")
-                st.markdown("*Click on any question to ask it:*")
-                
-                for i, (question, count) in enumerate(popular_questions, 1):
-                    if st.button(
-                        f"{i}. {question} ({count} times asked)",
-                        key=f"popular_{i}",
-                        help="Click to ask this question"
-                    ):
-                        st.session_state.user_question = question
-                        st.rerun()
-        except Exception as e:
-            logger.warning(f"Failed to load popular questions: {e}")
+        _popular_questions_fragment(self.analytics)
 
 
 # =============================================================================
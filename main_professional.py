@@ -12,13 +12,19 @@ Author: Senior Generative AI Applications Engineer
 """
 
 import streamlit as st
+import atexit
+import datetime
 import os
+import queue
+import random
+import threading
 import time
 import uuid
 import logging
 from typing import List, Optional
 from enum import Enum
 from dataclasses import dataclass
+from pathlib import Path
 from config import Config
 from analytics import ChatbotAnalytics
 
@@ -62,46 +68,113 @@ def get_user_session() -> UserSession:
         )
     return st.session_state.user_session
 
-def get_personalized_message(user_type: UserType) -> str:
-    """Get personalized welcome message based on user type."""
-    messages = {
-        UserType.HIRING_MANAGER: (
-            "Perfect! I'm here to highlight Noah's business impact, leadership potential, "
-            "and unique career journey. Focus on ROI, team dynamics, and measurable results."
-        ),
-        UserType.TECHNICAL_HIRING_MANAGER: (
-            "Excellent! I can dive deep into Noah's technical stack, architecture decisions, "
-            "and engineering approach while connecting it to business outcomes."
-        ),
-        UserType.SOFTWARE_DEVELOPER: (
-            "Great! Let's explore the technical implementation details, code patterns, "
-            "and engineering decisions behind this AI assistant and Noah's other projects."
-        ),
-        UserType.CASUAL_VISITOR: "Welcome! Let me show you the fun side of who Noah is!",
-        UserType.CRUSH_CONFESSOR: "Aww, that's sweet! Let me help you with that... 😉"
-    }
-    return messages.get(user_type, "Welcome! Ask me anything about Noah.")
+_PERSONALIZED_MESSAGES = {
+    UserType.HIRING_MANAGER.value: (
+        "Perfect! I'm here to highlight Noah's business impact, leadership potential, "
+        "and unique career journey. Focus on ROI, team dynamics, and measurable results."
+    ),
+    UserType.TECHNICAL_HIRING_MANAGER.value: (
+        "Excellent! I can dive deep into Noah's technical stack, architecture decisions, "
+        "and engineering approach while connecting it to business outcomes."
+    ),
+    UserType.SOFTWARE_DEVELOPER.value: (
+        "Great! Let's explore the technical implementation details, code patterns, "
+        "and engineering decisions behind this AI assistant and Noah's other projects."
+    ),
+    UserType.CASUAL_VISITOR.value: "Welcome! Let me show you the fun side of who Noah is!",
+    UserType.CRUSH_CONFESSOR.value: "Aww, that's sweet! Let me help you with that... 😉"
+}
+
+# (user_type, widget key, help text) for the selection screen, built once at import
+_USER_TYPE_BUTTONS = tuple(
+    (user_type, f"select_{user_type.name}", f"Select this if you are: {user_type.value}")
+    for user_type in UserType
+)
+
+SURPRISE_QUESTIONS = (
+    "What's Noah's technical background?",
+    "Tell me about Noah's MMA fighting experience",
+    "What AI projects has Noah worked on?",
+    "How did Noah transition from sales to tech?",
+    "What programming languages does Noah know?",
+    "What's unique about Noah's career journey?",
+    "Can you show me some of Noah's code examples?"
+)
+_RNG = random.Random()
+
+def _pick_surprise():
+    """Surprise button callback: fill the input before it is rendered this run."""
+    st.session_state.user_question = _RNG.choice(SURPRISE_QUESTIONS)
+    st.session_state.surprise_pending = True
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def get_personalized_message(user_type_value: str) -> str:
+    """Get personalized welcome message for a UserType value (a plain string cache key)."""
+    return _PERSONALIZED_MESSAGES.get(user_type_value, "Welcome! Ask me anything about Noah.")
+
+# Background storage writer: form submissions enqueue and return immediately
+WRITE_BATCH_SIZE = 32
+
+def _writer_loop(writes: queue.Queue) -> None:
+    """Drain queued (path, payload) writes in batches, one write_bytes call per record."""
+    created_dirs: set = set()  # the writer lives for the process, so each mkdir happens once
+    while True:
+        batch = [writes.get()]
+        while len(batch) < WRITE_BATCH_SIZE:
+            try:
+                batch.append(writes.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            for directory in {os.path.dirname(path) for path, _ in batch} - created_dirs:
+                os.makedirs(directory, exist_ok=True)
+                created_dirs.add(directory)
+            for path, payload in batch:
+                try:
+                    Path(path).write_bytes(payload)
+                except OSError as e:
+                    logger.error(f"Failed to write {path}: {e}")
+        except OSError as e:
+            logger.error(f"Storage batch failed ({len(batch)} records dropped): {e}")
+        finally:
+            for _ in batch:
+                writes.task_done()
+
+@st.cache_resource(show_spinner=False)
+def _get_write_queue() -> queue.Queue:
+    """Write queue plus its daemon writer thread, created once per process.
+
+    Lives in cache_resource rather than at module level because Streamlit
+    re-executes this script on every rerun.
+    """
+    writes: queue.Queue = queue.Queue()
+    threading.Thread(target=_writer_loop, args=(writes,), name="storage-writer", daemon=True).start()
+    atexit.register(writes.join)  # flush pending records on shutdown
+    return writes
+
+# Record file layouts, filled with one format_map pass per submission
+_CONFESSION_TMPL = "=== CONFESSION RECEIVED ===\nTime: {ts}\nType: {type}\n{id_block}\nMessage:\n{msg}\n"
+_MESSAGE_TMPL = (
+    "=== MESSAGE RECEIVED ===\nTime: {ts}\nName: {name}\nEmail: {email}\n"
+    "Subject: {subject}\n\nMessage:\n{msg}\n"
+)
 
 def store_confession_with_error_handling(confession: str, anonymous: bool = True, 
                                        name: str = "", email: str = "") -> bool:
-    """Store confession with proper error handling."""
+    """Queue a confession for storage; write failures are logged by the writer thread."""
     try:
-        import datetime
-        os.makedirs("confessions", exist_ok=True)
-        
-        timestamp = datetime.datetime.now().isoformat()
-        filename = f"confessions/confession_{timestamp.replace(':', '-')}.txt"
+        now = datetime.datetime.now()
+        filename = now.strftime("confessions/confession_%Y-%m-%dT%H-%M-%S.%f.txt")
+        id_block = "" if anonymous else f"Name: {name}\nEmail: {email}\n"
+        payload = _CONFESSION_TMPL.format_map({
+            "ts": now.isoformat(),
+            "type": "Anonymous" if anonymous else "Open",
+            "id_block": id_block,
+            "msg": confession,
+        }).encode('utf-8')
+        _get_write_queue().put_nowait((filename, payload))
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(f"=== CONFESSION RECEIVED ===\n")
-            f.write(f"Time: {timestamp}\n")
-            f.write(f"Type: {'Anonymous' if anonymous else 'Open'}\n")
-            if not anonymous:
-                f.write(f"Name: {name}\n")
-                f.write(f"Email: {email}\n")
-            f.write(f"\nMessage:\n{confession}\n")
-        
-        logger.info(f"Confession stored: {'anonymous' if anonymous else 'open'}")
+        logger.info(f"Confession queued: {'anonymous' if anonymous else 'open'}")
         return True
         
     except Exception as e:
@@ -109,52 +182,162 @@ def store_confession_with_error_handling(confession: str, anonymous: bool = True
         return False
 
 def store_message_with_error_handling(name: str, email: str, subject: str, message: str) -> bool:
-    """Store contact message with error handling."""
+    """Queue a contact message for storage; write failures are logged by the writer thread."""
     try:
-        import datetime
-        os.makedirs("messages", exist_ok=True)
-        
-        timestamp = datetime.datetime.now().isoformat()
-        filename = f"messages/message_{timestamp.replace(':', '-')}.txt"
+        now = datetime.datetime.now()
+        filename = now.strftime("messages/message_%Y-%m-%dT%H-%M-%S.%f.txt")
+        payload = _MESSAGE_TMPL.format_map({
+            "ts": now.isoformat(),
+            "name": name,
+            "email": email,
+            "subject": subject,
+            "msg": message,
+        }).encode('utf-8')
+        _get_write_queue().put_nowait((filename, payload))
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(f"=== MESSAGE RECEIVED ===\n")
-            f.write(f"Time: {timestamp}\n")
-            f.write(f"Name: {name}\n")
-            f.write(f"Email: {email}\n")
-            f.write(f"Subject: {subject}\n")
-            f.write(f"\nMessage:\n{message}\n")
-        
-        logger.info(f"Message stored from: {name}")
+        logger.info(f"Message queued from: {name}")
         return True
         
     except Exception as e:
         logger.error(f"Failed to store message: {e}")
         return False
 
+# Static page copy, defined once at import rather than inside the renderers;
+# sequential markdown calls are merged so each section is a single element
+_CASUAL_INTRO_MD = (
+    "# 🎲 Welcome, Random Visitor! 👋\n\n"
+    "Since you just stumbled upon this, let me give you the fun tour of who Noah is!\n\n"
+    "## 🚀 Noah's Wild Career Journey"
+)
+
+_CAREER_JOURNEY_MD = """
+**Plot twist alert!** 📈
+
+Noah went from:
+- 💪 **Gym sales guy** (learning to persuade people)
+- 🏠 **Real estate** (bigger sales, bigger stakes)  
+- 📦 **Logistics** (keeping stuff moving)
+- ⚡ **Tesla Sales** (now we're talking tech!)
+- 🤖 **AI Engineer** (current plot: building smart assistants)
+
+Oh, and he also had **10 MMA cage fights** along the way because... why not? 🥊
+"""
+
+_MMA_HIGHLIGHTS_MD = (
+    "---\n\n"
+    "## 🥊 MMA Highlights - The Good Stuff!\n\n"
+    "**10 cage fights, amateur & professional. Here's the crown jewel:**\n\n"
+    "### 🏆 Title Fight Victory\n\n"
+    "Noah defeated 5-0 fighter Edgar Sorto to win the **Fierce Fighting Championship amateur 135-lb title**!"
+)
+
+_FUN_FACTS_MD = (
+    "*Pretty cool for a guy who now codes AI assistants, right?* 😎\n\n"
+    "---\n\n"
+    "## 🌟 Random Fun Facts\n\n"
+    + "\n".join(f"- {fact}" for fact in (
+        "🌭 Can eat 10 hotdogs in one sitting (verified!)",
+        "🧠 Got into AI after watching AlphaZero demolish Stockfish in 2017",
+        "💻 Went from zero coding to building this AI assistant in months",
+        "🎯 Chose Tesla as a 'bridge job' to transition from sales to tech",
+        "🤖 Uses GitHub Copilot and Claude to accelerate development (smart, not lazy!)",
+    ))
+    + "\n\n---\n\n## 💬 Want to Connect with Noah?"
+)
+
+_CASUAL_EASTER_EGG_MD = (
+    "---\n\n"
+    "*P.S. This AI assistant you're using? Noah built it with clean architecture principles. Meta, right?* 🤯"
+)
+
+_CRUSH_INTRO_MD = (
+    "# 😍 Aww, That's So Sweet! 💕\n\n"
+    "Someone has a crush on Noah! Let me help you with that... 😉\n\n"
+    "## ✨ What Makes Noah So Crush-Worthy?"
+)
+
+_CRUSH_QUALITIES_MD = """
+**🔥 The Attractive Qualities:**
+- 💪 **MMA Fighter**: 10 cage fights, championship title holder
+- 🧠 **Smart Career Pivot**: Sales → AI Engineering (strategic thinker!)
+- 🚀 **Self-Driven**: Learned coding and built this AI assistant
+- 💼 **Business Savvy**: Understands both tech and business sides
+- 🎯 **Goal-Oriented**: Clear 3-year vision, works toward it daily
+"""
+
+_CRUSH_TRAITS_MD = """
+**😊 The Personality Traits:**
+- 🤝 **Great Communicator**: Bridges technical and non-technical teams
+- 💡 **Problem Solver**: Finds creative solutions to complex challenges
+- 📈 **Growth Mindset**: Constantly learning and improving
+- 🏆 **Competitive**: But in a healthy, motivating way
+- 🌭 **Fun Side**: Can eat 10 hotdogs in one sitting (impressive!)
+"""
+
+_CONFESS_PROMPT_MD = (
+    "---\n\n"
+    "## 💌 Ready to Confess?\n\n"
+    "**Would you like to confess anonymously or openly?**"
+)
+
+_ANONYMOUS_CONFESSION_MD = (
+    "---\n\n"
+    "### 🕶️ Anonymous Confession\n\n"
+    "*Your identity will remain completely private!*"
+)
+
+_OPEN_CONFESSION_MD = (
+    "---\n\n"
+    "### 😊 Open Confession\n\n"
+    "*Let Noah know who you are!*"
+)
+
+_SIDEBAR_ABOUT_MD = """
+### 🏗️ Enhanced Features
+
+**Professional improvements:**
+- 🎯 Type-safe enums & dataclasses
+- 🛡️ Comprehensive error handling  
+- 📊 Professional logging system
+- ⚡ Performance optimizations
+- 📝 Enhanced documentation
+
+---
+
+### 🤖 About This Assistant
+
+This AI assistant knows all about Noah's:
+- 🎯 **Career journey** from sales to AI engineering
+- 💻 **Technical skills** and project experience  
+- 🥊 **MMA background** (10 cage fights!)
+- 🚀 **Goals and aspirations** in tech
+- 📈 **Business acumen** and leadership experience
+"""
+
+@st.cache_data(show_spinner=False)
+def _technical_details_md(model: str, temperature: float) -> str:
+    """Sidebar technical details; only the model settings vary."""
+    return f"""
+---
+
+### 🛠️ Technical Details
+
+- **Model**: {model}
+- **Temperature**: {temperature}
+- **Vector Store**: FAISS
+- **Architecture**: Enhanced & Professional
+"""
+
 # Helper functions for special user experiences
 def render_casual_visitor_experience():
     """Enhanced casual visitor experience with improved organization."""
-    st.markdown("# 🎲 Welcome, Random Visitor! 👋")
-    st.markdown("Since you just stumbled upon this, let me give you the fun tour of who Noah is!")
-    
-    # Career overview in casual tone
-    st.markdown("## 🚀 Noah's Wild Career Journey")
+    ss = st.session_state
+    # Intro and career overview in casual tone
+    st.markdown(_CASUAL_INTRO_MD)
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        st.markdown("""
-        **Plot twist alert!** 📈
-        
-        Noah went from:
-        - 💪 **Gym sales guy** (learning to persuade people)
-        - 🏠 **Real estate** (bigger sales, bigger stakes)  
-        - 📦 **Logistics** (keeping stuff moving)
-        - ⚡ **Tesla Sales** (now we're talking tech!)
-        - 🤖 **AI Engineer** (current plot: building smart assistants)
-        
-        Oh, and he also had **10 MMA cage fights** along the way because... why not? 🥊
-        """)
+        st.markdown(_CAREER_JOURNEY_MD)
     
     with col2:
         try:
@@ -167,37 +350,13 @@ def render_casual_visitor_experience():
         except:
             st.markdown("🖼️ *[Noah's photo would go here]*")
     
-    # MMA Highlights Section
-    st.markdown("---")
-    st.markdown("## 🥊 MMA Highlights - The Good Stuff!")
-    st.markdown("**10 cage fights, amateur & professional. Here's the crown jewel:**")
-    
-    st.markdown("### 🏆 Title Fight Victory")
-    st.markdown("Noah defeated 5-0 fighter Edgar Sorto to win the **Fierce Fighting Championship amateur 135-lb title**!")
-    
-    # Main highlight video
+    # MMA Highlights Section with the main highlight video
+    st.markdown(_MMA_HIGHLIGHTS_MD)
     video_url = "https://www.youtube.com/watch?v=MgcAdEoJMzg"
     st.video(video_url)
     
-    st.markdown("*Pretty cool for a guy who now codes AI assistants, right?* 😎")
-    
-    # Fun Facts Section
-    st.markdown("---")
-    st.markdown("## 🌟 Random Fun Facts")
-    fun_facts = [
-        "🌭 Can eat 10 hotdogs in one sitting (verified!)",
-        "🧠 Got into AI after watching AlphaZero demolish Stockfish in 2017",
-        "💻 Went from zero coding to building this AI assistant in months",
-        "🎯 Chose Tesla as a 'bridge job' to transition from sales to tech",
-        "🤖 Uses GitHub Copilot and Claude to accelerate development (smart, not lazy!)"
-    ]
-    
-    for fact in fun_facts:
-        st.markdown(f"- {fact}")
-    
-    # Contact Section with Form
-    st.markdown("---")
-    st.markdown("## 💬 Want to Connect with Noah?")
+    # Fun Facts Section, then the contact heading
+    st.markdown(_FUN_FACTS_MD)
     
     col1, col2 = st.columns(2)
     
@@ -207,10 +366,10 @@ def render_casual_visitor_experience():
     
     with col2:
         if st.button("📧 Leave Noah a Message", use_container_width=True):
-            st.session_state.show_contact_form = True
+            ss.show_contact_form = True
     
     # Contact form
-    if st.session_state.get("show_contact_form", False):
+    if ss.get("show_contact_form", False):
         st.markdown("### 📧 Leave Noah a Message")
         
         with st.form("contact_form_casual"):
@@ -227,11 +386,13 @@ def render_casual_visitor_experience():
             submitted = st.form_submit_button("📤 Send Message")
             
             if submitted:
-                if all([name.strip(), email.strip(), subject.strip(), message.strip()]):
-                    success = store_message_with_error_handling(name.strip(), email.strip(), subject.strip(), message.strip())
+                name, email = name.strip(), email.strip()
+                subject, message = subject.strip(), message.strip()
+                if name and email and subject and message:
+                    success = store_message_with_error_handling(name, email, subject, message)
                     if success:
                         st.success("✅ Message sent to Noah! He'll get back to you soon.")
-                        st.session_state.show_contact_form = False
+                        ss.show_contact_form = False
                         st.rerun()
                     else:
                         st.error("❌ Failed to send message. Please try again.")
@@ -239,59 +400,38 @@ def render_casual_visitor_experience():
                     st.error("Please fill in all fields!")
     
     # Easter egg message
-    st.markdown("---")
-    st.markdown("*P.S. This AI assistant you're using? Noah built it with clean architecture principles. Meta, right?* 🤯")
+    st.markdown(_CASUAL_EASTER_EGG_MD)
 
 def render_crush_confession_experience():
     """Enhanced crush confession experience with proper form handling."""
-    st.markdown("# 😍 Aww, That's So Sweet! 💕")
-    st.markdown("Someone has a crush on Noah! Let me help you with that... 😉")
-    
-    # What makes Noah attractive
-    st.markdown("## ✨ What Makes Noah So Crush-Worthy?")
+    ss = st.session_state
+    # Intro and what makes Noah attractive
+    st.markdown(_CRUSH_INTRO_MD)
     
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("""
-        **🔥 The Attractive Qualities:**
-        - 💪 **MMA Fighter**: 10 cage fights, championship title holder
-        - 🧠 **Smart Career Pivot**: Sales → AI Engineering (strategic thinker!)
-        - 🚀 **Self-Driven**: Learned coding and built this AI assistant
-        - 💼 **Business Savvy**: Understands both tech and business sides
-        - 🎯 **Goal-Oriented**: Clear 3-year vision, works toward it daily
-        """)
+        st.markdown(_CRUSH_QUALITIES_MD)
     
     with col2:
-        st.markdown("""
-        **😊 The Personality Traits:**
-        - 🤝 **Great Communicator**: Bridges technical and non-technical teams
-        - 💡 **Problem Solver**: Finds creative solutions to complex challenges
-        - 📈 **Growth Mindset**: Constantly learning and improving
-        - 🏆 **Competitive**: But in a healthy, motivating way
-        - 🌭 **Fun Side**: Can eat 10 hotdogs in one sitting (impressive!)
-        """)
+        st.markdown(_CRUSH_TRAITS_MD)
     
     # Confession options
-    st.markdown("---")
-    st.markdown("## 💌 Ready to Confess?")
-    st.markdown("**Would you like to confess anonymously or openly?**")
+    st.markdown(_CONFESS_PROMPT_MD)
     
     col1, col2 = st.columns(2)
     
     with col1:
         if st.button("🕶️ Anonymous Confession", use_container_width=True):
-            st.session_state.confession_type = "anonymous"
+            ss.confession_type = "anonymous"
             
     with col2:
         if st.button("😊 Open Confession", use_container_width=True):
-            st.session_state.confession_type = "open"
+            ss.confession_type = "open"
     
     # Handle confession forms
-    if st.session_state.get("confession_type") == "anonymous":
-        st.markdown("---")
-        st.markdown("### 🕶️ Anonymous Confession")
-        st.markdown("*Your identity will remain completely private!*")
+    if ss.get("confession_type") == "anonymous":
+        st.markdown(_ANONYMOUS_CONFESSION_MD)
         
         confession = st.text_area(
             "Share your feelings:",
@@ -308,10 +448,8 @@ def render_crush_confession_experience():
             else:
                 st.error("❌ Failed to send confession. Please try again.")
     
-    elif st.session_state.get("confession_type") == "open":
-        st.markdown("---")
-        st.markdown("### 😊 Open Confession")
-        st.markdown("*Let Noah know who you are!*")
+    elif ss.get("confession_type") == "open":
+        st.markdown(_OPEN_CONFESSION_MD)
         
         with st.form("open_confession_form"):
             col1, col2 = st.columns(2)
@@ -331,16 +469,17 @@ def render_crush_confession_experience():
             submitted = st.form_submit_button("💌 Send Open Confession")
             
             if submitted:
-                if not all([name.strip(), email.strip(), confession.strip()]):
+                name, email, confession = name.strip(), email.strip(), confession.strip()
+                if not (name and email and confession):
                     st.error("Please fill in all fields!")
                 elif not consent:
                     st.error("Please confirm your consent to share contact information.")
                 else:
                     success = store_confession_with_error_handling(
-                        confession.strip(), 
+                        confession, 
                         anonymous=False, 
-                        name=name.strip(), 
-                        email=email.strip()
+                        name=name, 
+                        email=email
                     )
                     
                     if success:
@@ -352,30 +491,11 @@ def render_crush_confession_experience():
 def render_enhanced_sidebar(config: Config, analytics: ChatbotAnalytics):
     """Render enhanced sidebar with professional information."""
     with st.sidebar:
-        st.markdown("### 🏗️ Enhanced Features")
-        st.markdown("""
-        **Professional improvements:**
-        - 🎯 Type-safe enums & dataclasses
-        - 🛡️ Comprehensive error handling  
-        - 📊 Professional logging system
-        - ⚡ Performance optimizations
-        - 📝 Enhanced documentation
-        """)
-        
-        st.markdown("---")
-        st.markdown("### 🤖 About This Assistant")
-        st.markdown("""
-        This AI assistant knows all about Noah's:
-        - 🎯 **Career journey** from sales to AI engineering
-        - 💻 **Technical skills** and project experience  
-        - 🥊 **MMA background** (10 cage fights!)
-        - 🚀 **Goals and aspirations** in tech
-        - 📈 **Business acumen** and leadership experience
-        """)
+        st.markdown(_SIDEBAR_ABOUT_MD)
         
         # Display analytics if available
         try:
-            stats = analytics.get_summary_stats()
+            stats = _cached_summary()
             st.markdown("---")
             st.markdown("### 📊 Usage Stats")
             st.metric("Total Questions", stats.get("total_questions", 0))
@@ -386,15 +506,7 @@ def render_enhanced_sidebar(config: Config, analytics: ChatbotAnalytics):
             pass  # Graceful degradation
         
         # Technical details
-        st.markdown("---")
-        st.markdown("### 🛠️ Technical Details")
-        st.markdown(f"""
-        - **Model**: {config.model_name}
-        - **Temperature**: {config.temperature}
-        - **Max Tokens**: {config.max_tokens}
-        - **Vector Store**: FAISS
-        - **Architecture**: Enhanced & Professional
-        """)
+        st.markdown(_technical_details_md(config.OPENAI_MODEL, config.OPENAI_TEMPERATURE))
 
 # Initialize application dependencies
 @st.cache_resource
@@ -418,13 +530,25 @@ def get_qa_chain():
         st.error("⚠️ Failed to initialize AI assistant. Please check configuration.")
         return None
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_summary() -> dict:
+    """Sidebar usage stats, re-queried at most every 30 seconds."""
+    return get_analytics().get_summary_stats()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_popular(limit: int) -> list:
+    """Most-asked questions, re-queried at most every 30 seconds."""
+    return get_analytics().get_popular_questions(limit=limit)
+
 def main():
     """Enhanced main application with professional patterns."""
+    ss = st.session_state
     
     # Initialize dependencies
     config = get_config()
     analytics = get_analytics()
     qa_chain = get_qa_chain()
+    debug_mode = getattr(config, "debug_mode", False)
     
     if not qa_chain:
         st.error("🚨 Unable to initialize the AI assistant. Please check the configuration.")
@@ -444,12 +568,12 @@ def main():
         st.markdown("In order for me to best assist you, which best describes you?")
         
         # Create elegant button layout for user selection
-        for user_type in UserType:
+        for user_type, key, help_text in _USER_TYPE_BUTTONS:
             if st.button(
                 user_type.value,
-                key=f"select_{user_type.name}",
+                key=key,
                 use_container_width=True,
-                help=f"Select this if you are: {user_type.value}"
+                help=help_text
             ):
                 session.user_type = user_type
                 logger.info(f"User selected: {user_type.value}")
@@ -466,7 +590,7 @@ def main():
         
     else:
         # Regular chat experience with personalization
-        welcome_message = get_personalized_message(session.user_type)
+        welcome_message = get_personalized_message(session.user_type.value)
         st.markdown(f"### {welcome_message}")
         
         # Enhanced question input with better UX
@@ -474,16 +598,6 @@ def main():
         
         col1, col2, col3 = st.columns([3, 1, 1])
         
-        surprise_questions = [
-            "What's Noah's technical background?",
-            "Tell me about Noah's MMA fighting experience", 
-            "What AI projects has Noah worked on?",
-            "How did Noah transition from sales to tech?",
-            "What programming languages does Noah know?",
-            "What's unique about Noah's career journey?",
-            "Can you show me some of Noah's code examples?"
-        ]
-        
         with col1:
             user_question = st.text_input(
                 "Your question:",
@@ -496,14 +610,10 @@ def main():
             ask_button = st.button("🚀 Ask", use_container_width=True)
         
         with col3:
-            surprise_button = st.button("🎲 Surprise Me", use_container_width=True)
+            st.button("🎲 Surprise Me", use_container_width=True, on_click=_pick_surprise)
         
-        # Handle surprise question
-        if surprise_button:
-            import random
-            selected_question = random.choice(surprise_questions)
-            st.session_state.user_question = selected_question
-            user_question = selected_question
+        # Ask straight away when the question came from "Surprise Me"
+        if ss.pop("surprise_pending", False):
             ask_button = True
         
         # Process question with enhanced error handling
@@ -524,7 +634,7 @@ def main():
                 st.markdown(result["result"])
                 
                 # Debug information (if enabled)
-                if config.debug_mode:
+                if debug_mode:
                     with st.expander("🐛 Debug Information"):
                         st.metric("Response Time", f"{response_time:.2f}s")
                         if "source_documents" in result:
@@ -534,14 +644,19 @@ def main():
                 
                 # Track analytics with error handling
                 try:
-                    analytics.log_question(
-                        session_id=session.session_id,
-                        user_type=session.user_type.value,
+                    # Synchronous single INSERT (milliseconds): the row is committed before
+                    # the caches are cleared, so the popular list and sidebar below re-read it
+                    analytics.log_interaction(
                         question=user_question,
                         answer=result["result"],
-                        response_time=response_time
+                        source_count=len(result.get("source_documents", [])),
+                        response_time_ms=response_time * 1000,
+                        metadata={"user_type": session.user_type.value},
+                        session_id=session.session_id
                     )
                     session.questions_asked += 1
+                    _cached_summary.clear()
+                    _cached_popular.clear()
                 except Exception as e:
                     logger.warning(f"Analytics tracking failed: {e}")
                 
@@ -562,19 +677,20 @@ def main():
                 
                 # Show popular questions
                 try:
-                    popular_questions = analytics.get_popular_questions(limit=5)
+                    popular_questions = _cached_popular(5)
                     if popular_questions:
                         st.markdown("---")
                         st.markdown("### 🔥 Popular Questions")
                         st.markdown("*Click on any question to ask it:*")
                         
-                        for i, (question, count) in enumerate(popular_questions, 1):
+                        for i, item in enumerate(popular_questions, 1):
+                            question = item["question"]
                             if st.button(
-                                f"{i}. {question} ({count} times asked)",
+                                f"{i}. {question} ({item['frequency']} times asked)",
                                 key=f"popular_{i}",
                                 help="Click to ask this question"
                             ):
-                                st.session_state.user_question = question
+                                ss.user_question = question
                                 st.rerun()
                 except Exception as e:
                     logger.warning(f"Failed to load popular questions: {e}")
@@ -582,7 +698,7 @@ def main():
             except Exception as e:
                 logger.error(f"Question processing failed: {e}")
                 st.error("🚨 Sorry, I encountered an error processing your question. Please try again.")
-                if config.debug_mode:
+                if debug_mode:
                     st.exception(e)
     
     # Enhanced sidebar
@@ -592,10 +708,10 @@ def main():
     with st.sidebar:
         if st.button("🔄 Change User Type", use_container_width=True):
             # Reset session state
-            if "user_session" in st.session_state:
-                del st.session_state.user_session
-            if "user_question" in st.session_state:
-                del st.session_state["user_question"]
+            if "user_session" in ss:
+                del ss.user_session
+            if "user_question" in ss:
+                del ss["user_question"]
             logger.info("User session reset")
             st.rerun()
 
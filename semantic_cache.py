@@ -0,0 +1,177 @@
+"""
+Semantic Answer Cache
+=====================
+
+Embedding-keyed cache that lets paraphrased questions ("What is Noah's
+background?" vs "Tell me about Noah's background") reuse a stored answer
+instead of paying for retrieval + LLM generation again.
+
+Key Patterns:
+- FAISS inner-product index over L2-normalized query vectors (cosine similarity)
+- Parallel Python list of (answer, source_documents) payloads
+- Exact-text map in front of the index so verbatim repeats skip the embedding call
+- Optional persistence to disk so warm entries survive restarts
+- Generation counter bumped by clear() so writers started earlier can't re-add stale answers
+"""
+
+import os
+import pickle
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import faiss
+import numpy as np
+
+DEFAULT_INDEX_PATH = "semantic_cache.faiss"
+DEFAULT_STORE_PATH = "semantic_cache.pkl"
+
+
+class SemanticCache:
+    """Nearest-neighbour answer cache keyed by question embeddings."""
+
+    def __init__(self,
+                 embed_fn: Callable[[str], Sequence[float]],
+                 threshold: float = 0.92,
+                 index_path: str = DEFAULT_INDEX_PATH,
+                 store_path: str = DEFAULT_STORE_PATH):
+        """
+        Args:
+            embed_fn: Function mapping a question to its embedding vector
+            threshold: Minimum cosine similarity for a cached answer to be reused
+            index_path: File used to persist the FAISS index
+            store_path: File used to persist the cached payloads
+        """
+        self.embed_fn = embed_fn
+        self.threshold = threshold
+        self.index_path = index_path
+        self.store_path = store_path
+        self._index: Optional[faiss.Index] = None
+        self._entries: List[Any] = []
+        self._exact: Dict[str, int] = {}  # normalized question -> entry position (in memory only)
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        """Incremented by clear(); capture it before computing an answer and pass it to add()."""
+        return self._generation
+
+    @staticmethod
+    def normalize(question: str) -> str:
+        """Case- and whitespace-insensitive key for exact repeats."""
+        return " ".join(question.lower().split())
+
+    def _exact_hit(self, question: str) -> Optional[Tuple[Any, np.ndarray]]:
+        """Payload and stored vector for a verbatim repeat; caller holds the lock."""
+        pos = self._exact.get(self.normalize(question))
+        if pos is None:
+            return None
+        return self._entries[pos], self._index.reconstruct(pos).reshape(1, -1)
+
+    def embed(self, question: str) -> np.ndarray:
+        """Embed and L2-normalize a question as a (1, d) float32 matrix."""
+        vec = np.asarray(self.embed_fn(question), dtype="float32").reshape(1, -1)
+        faiss.normalize_L2(vec)
+        return vec
+
+    def lookup(self, question: str,
+               vec: Optional[np.ndarray] = None) -> Tuple[Optional[Any], np.ndarray]:
+        """
+        Find a cached payload for a semantically equivalent question.
+
+        Args:
+            question: Question text
+            vec: Query vector already computed with embed()/lookup_many(), if any;
+                 skips the embedding call
+
+        Returns:
+            Tuple of (payload or None, query vector). The vector is returned so
+            a miss can be stored with add() without embedding the question twice.
+        """
+        with self._lock:
+            hit = self._exact_hit(question)
+        if hit is not None:
+            return hit
+        if vec is None:
+            vec = self.embed(question)
+        with self._lock:
+            if self._index is None or self._index.ntotal == 0:
+                return None, vec
+            scores, ids = self._index.search(vec, 1)
+            if ids[0][0] >= 0 and scores[0][0] >= self.threshold:
+                return self._entries[ids[0][0]], vec
+        return None, vec
+
+    def lookup_many(self, questions: Sequence[str],
+                    embed_many_fn: Callable[[List[str]], Sequence[Sequence[float]]]
+                    ) -> List[Tuple[Optional[Any], np.ndarray]]:
+        """
+        Batched lookup(): one embedding request and one index search for all questions.
+
+        Returns:
+            List of (payload or None, (1, d) query vector) in input order
+        """
+        vecs = np.asarray(embed_many_fn(list(questions)), dtype="float32")
+        faiss.normalize_L2(vecs)
+        hits: List[Optional[Any]] = [None] * len(questions)
+        with self._lock:
+            if self._index is not None and self._index.ntotal > 0:
+                scores, ids = self._index.search(vecs, 1)
+                for row, (score, idx) in enumerate(zip(scores[:, 0], ids[:, 0])):
+                    if idx >= 0 and score >= self.threshold:
+                        hits[row] = self._entries[idx]
+        return [(hit, vecs[row:row + 1]) for row, hit in enumerate(hits)]
+
+    def add(self, vec: np.ndarray, payload: Any, question: Optional[str] = None,
+            generation: Optional[int] = None) -> None:
+        """Store a payload under an already-normalized query vector.
+
+        Passing the question text lets later verbatim repeats hit without embedding.
+        Passing the generation read before the answer was computed drops the payload
+        if clear() ran in between (e.g. the answer came from a pre-rebuild index).
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            if self._index is None:
+                self._index = faiss.IndexFlatIP(vec.shape[1])
+            self._index.add(vec)
+            self._entries.append(payload)
+            if question is not None:
+                self._exact[self.normalize(question)] = len(self._entries) - 1
+
+    def clear(self) -> None:
+        """Drop all cached answers (e.g. after the knowledge base is rebuilt)."""
+        with self._lock:
+            self._index = None
+            self._entries = []
+            self._exact = {}
+            self._generation += 1
+        for path in (self.index_path, self.store_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def save(self) -> None:
+        """Persist the index and payloads to disk."""
+        with self._lock:
+            if self._index is None or not self._entries:
+                return
+            faiss.write_index(self._index, self.index_path)
+            with open(self.store_path, "wb") as f:
+                pickle.dump(self._entries, f)
+
+    def _load(self) -> None:
+        if not (os.path.exists(self.index_path) and os.path.exists(self.store_path)):
+            return
+        try:
+            index = faiss.read_index(self.index_path)
+            with open(self.store_path, "rb") as f:
+                entries = pickle.load(f)
+        except Exception:
+            return  # a corrupt cache is simply rebuilt
+        if index.ntotal == len(entries):
+            self._index, self._entries = index, entries
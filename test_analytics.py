@@ -43,7 +43,9 @@ try:
     
     # Clean up test database
     if os.path.exists("test_analytics.db"):
-        os.remove("test_analytics.db")
+        for suffix in ("", "-wal", "-shm"):  # WAL mode keeps two sidecar files
+            if os.path.exists("test_analytics.db" + suffix):
+                os.remove("test_analytics.db" + suffix)
         print("🧹 Test database cleaned up")
 
 except Exception as e: